@@ -21,9 +21,9 @@ def _run_server() -> None:
         os.environ["G2_LOCAL_AUDIO"] = "true"
         sys.argv.remove("--local-audio")
 
-    from gateway.server import main
+    from gateway.server import event_loop_factory, main
 
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=event_loop_factory())
 
 
 def _run_cli() -> None:
@@ -36,12 +36,10 @@ def _run_cli() -> None:
     app()
 
 
-if __name__ == "__main__" or not sys.argv[0].endswith("__main__.py"):
-    pass  # allow import without side-effects
-
-# Route based on first positional arg
-_cli_commands = {"init-env", "launch", "push-config", "stop"}
-if len(sys.argv) > 1 and sys.argv[1] in _cli_commands:
+# Route based on first positional arg.  The server branch must never import
+# ``gateway.cli`` (typer/rich) — see tests/gateway/test_main.py.
+_CLI_COMMANDS = frozenset(("init-env", "launch", "push-config", "stop"))
+if len(sys.argv) > 1 and sys.argv[1] in _CLI_COMMANDS:
     _run_cli()
 else:
     _run_server()
@@ -4,6 +4,11 @@ from __future__ import annotations
 
 import numpy as np
 
+# Exact power-of-two scale, so multiplying matches dividing by 32768
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+# Stereo downmix: (L + R) / 2 folded into the same exact power-of-two scale
+_INT16_PAIR_SCALE = np.float32(1.0 / 65536.0)
+
 
 class BufferOverflow(Exception):
     """Raised when audio buffer exceeds maximum duration."""
@@ -21,6 +26,16 @@ class AudioBuffer:
         sample_width: int = 2,
     ) -> None:
         """Accept format params from start_audio frame."""
+        self._buf = bytearray()
+        self._mv = memoryview(self._buf)
+        self.reconfigure(sample_rate, channels, sample_width)
+
+    def reconfigure(self, sample_rate: int, channels: int, sample_width: int) -> None:
+        """Apply new format params and clear the buffer for the next recording.
+
+        The backing storage is only reallocated when the new format needs
+        more room than the current allocation.
+        """
         self.sample_rate = sample_rate
         self.channels = channels
         self.sample_width = sample_width  # bytes per sample (2 = 16-bit)
@@ -28,7 +43,10 @@ class AudioBuffer:
         self._max_bytes = self.MAX_DURATION_SECONDS * self._byte_rate
         # Absolute cap regardless of format parameters (5 MB)
         self._max_bytes = min(self._max_bytes, 5 * 1024 * 1024)
-        self._chunks: list[bytes] = []
+        # Preallocated; chunks are copied in at the write cursor
+        if self._max_bytes > len(self._buf):
+            self._buf = bytearray(self._max_bytes)
+            self._mv = memoryview(self._buf)
         self._total_bytes = 0
 
     def append(self, chunk: bytes) -> None:
@@ -40,31 +58,43 @@ class AudioBuffer:
                 f"Chunk size ({len(chunk)}) must be a multiple of "
                 f"sample width ({self.sample_width})"
             )
-        if self._total_bytes + len(chunk) > self._max_bytes:
+        end = self._total_bytes + len(chunk)
+        if end > self._max_bytes:
             raise BufferOverflow(
-                f"Audio buffer overflow: {self._total_bytes + len(chunk)} bytes "
+                f"Audio buffer overflow: {end} bytes "
                 f"exceeds {self.MAX_DURATION_SECONDS}s limit ({self._max_bytes} bytes)"
             )
-        self._chunks.append(chunk)
-        self._total_bytes += len(chunk)
+        self._mv[self._total_bytes : end] = chunk
+        self._total_bytes = end
 
     def to_numpy(self) -> np.ndarray:
         """Convert accumulated PCM to float32 array normalized to [-1.0, 1.0].
 
-        Assumes 16-bit signed integer PCM (sample_width=2).
+        Assumes 16-bit signed integer PCM (sample_width=2).  Stereo input is
+        downmixed to mono, since Whisper expects a single channel.
 
         Raises:
             ValueError: If sample_width is not 2 (only 16-bit PCM supported).
         """
         if self.sample_width != 2:
             raise ValueError(f"to_numpy() requires sample_width=2, got {self.sample_width}")
-        raw = b"".join(self._chunks)
-        samples = np.frombuffer(raw, dtype=np.int16)
-        return samples.astype(np.float32) / 32768.0
+        samples = np.frombuffer(self._mv[: self._total_bytes], dtype=np.int16)
+        scale = _INT16_SCALE
+        if self.channels == 2:
+            # Sum L/R in int32 (exact) and halve inside the float scale below;
+            # a trailing partial frame is dropped.
+            n = samples.shape[0] // 2 * 2
+            samples = np.add(samples[0:n:2], samples[1:n:2], dtype=np.int32)
+            scale = _INT16_PAIR_SCALE
+        # Single fused int -> float32 scale pass with no intermediate array.
+        # A fresh output per call: the result is handed to an executor thread
+        # that may outlive this recording.
+        out = np.empty(samples.shape[0], dtype=np.float32)
+        np.multiply(samples, scale, out=out, dtype=np.float32)
+        return out
 
     def reset(self) -> None:
         """Clear buffer for next recording."""
-        self._chunks.clear()
         self._total_bytes = 0
 
     @property
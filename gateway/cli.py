@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import contextlib
 import ctypes
-import json
+import functools
 import os
 import re
 import secrets
@@ -19,14 +19,16 @@ import sys
 import threading
 import time
 from pathlib import Path
-from typing import IO, Any
+from typing import IO, TYPE_CHECKING, Any
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
+
+from gateway import json_codec
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(help="G2 OpenClaw Gateway CLI utilities.")
-console = Console()
 
 # ---------------------------------------------------------------------------
 # Root of the repository (parent of the ``gateway/`` package)
@@ -34,24 +36,55 @@ console = Console()
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 
+@functools.cache
+def _get_console() -> Console:
+    """Return the shared rich console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
 # ---------------------------------------------------------------------------
 # GPU detection
 # ---------------------------------------------------------------------------
 
 
+_PCI_DEVICES_ROOT = Path("/sys/bus/pci/devices")
+_NVIDIA_PCI_VENDOR = "0x10de"
+# WSL2 exposes the GPU through the DirectX paravirtual device, not the PCI bus
+_WSL_GPU_DEVICE = Path("/dev/dxg")
+
+
+def _has_nvidia_pci(devices_root: Path = _PCI_DEVICES_ROOT) -> bool:
+    """Return *True* if any PCI device reports the NVIDIA vendor ID."""
+    for vendor_file in devices_root.glob("*/vendor"):
+        try:
+            if vendor_file.read_text(encoding="ascii").strip().lower() == _NVIDIA_PCI_VENDOR:
+                return True
+        except (OSError, UnicodeDecodeError):
+            continue
+    return False
+
+
 def _detect_gpu() -> tuple[str | None, float]:
     """Detect NVIDIA GPU via ``nvidia-smi``.
 
+    On Linux the PCI bus is scanned first so machines without an NVIDIA
+    device never spawn ``nvidia-smi`` (which can hang when the binary is
+    installed but the kernel driver is not loaded).
+
     Returns:
         A tuple of ``(gpu_name, vram_gb)``.  ``gpu_name`` is *None* when no
         GPU is found.
     """
+    if sys.platform.startswith("linux") and not _WSL_GPU_DEVICE.exists() and not _has_nvidia_pci():
+        return None, 0.0
     try:
         result = subprocess.run(
             ["nvidia-smi", "--query-gpu=name,memory.total", "--format=csv,noheader"],
             capture_output=True,
             text=True,
-            timeout=10,
+            timeout=5,
         )
         if result.returncode != 0:
             return None, 0.0
@@ -65,14 +98,14 @@ def _parse_gpu_output(output: str) -> tuple[str | None, float]:
 
     Expected format: ``NVIDIA GeForce RTX 3060, 12288 MiB``
     """
-    line = output.strip().split("\n")[0].strip()
+    line = output.strip().partition("\n")[0].strip()
     if not line:
         return None, 0.0
-    parts = [p.strip() for p in line.split(",")]
-    if len(parts) < 2:
+    gpu_name, sep, rest = line.partition(",")
+    if not sep:
         return None, 0.0
-    gpu_name = parts[0]
-    vram_str = parts[1].lower().replace("mib", "").strip()
+    gpu_name = gpu_name.strip()
+    vram_str = rest.partition(",")[0].strip().lower().removesuffix("mib").strip()
     try:
         vram_mb = float(vram_str)
     except ValueError:
@@ -166,12 +199,12 @@ def _read_openclaw_config(
     if not config_path.is_file():
         return None, 18789
     try:
-        data = json.loads(config_path.read_text(encoding="utf-8"))
+        data = json_codec.loads(config_path.read_bytes())
         gw = data.get("gateway", {})
         token = gw.get("auth", {}).get("token")
         port = gw.get("port", 18789)
         return token, int(port)
-    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+    except (json_codec.JSONDecodeError, KeyError, TypeError, ValueError):
         return None, 18789
 
 
@@ -180,8 +213,9 @@ def _read_openclaw_config(
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
 def _get_local_ip() -> str:
-    """Return the local network IP address (best-effort)."""
+    """Return the local network IPv4 address (best-effort, cached per process)."""
     try:
         # Connect to a public address (no actual traffic) to find the local IP.
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
@@ -190,8 +224,11 @@ def _get_local_ip() -> str:
             return addr
     except OSError:
         try:
-            return socket.gethostbyname(socket.gethostname())
-        except socket.gaierror:
+            # Ask for IPv4 only — avoids slow IPv6-first resolution on
+            # misconfigured hosts.
+            infos = socket.getaddrinfo(socket.gethostname(), None, family=socket.AF_INET)
+            return str(infos[0][4][0])
+        except (socket.gaierror, IndexError):
             return "127.0.0.1"
 
 
@@ -200,26 +237,7 @@ def _get_local_ip() -> str:
 # ---------------------------------------------------------------------------
 
 
-def _render_env(
-    *,
-    local_ip: str,
-    gateway_token: str,
-    whisper_model: str,
-    whisper_device: str,
-    whisper_compute_type: str,
-    gpu_label: str,
-    openclaw_port: int,
-    openclaw_token: str | None,
-) -> str:
-    """Render the ``.env`` file contents."""
-    oc_token_line = openclaw_token or ""
-    oc_comment = (
-        "# Read from ~/.openclaw/openclaw.json → gateway.auth.token"
-        if openclaw_token
-        else "# Not found in ~/.openclaw/openclaw.json — set manually if needed"
-    )
-
-    return f"""\
+_ENV_TEMPLATE = """\
 # G2 OpenClaw Gateway — Environment Configuration
 # Generated by: python -m gateway init-env
 # See gateway/config.py for full documentation of each variable.
@@ -251,6 +269,39 @@ AGENT_TIMEOUT=120
 """
 
 
+def _render_env(
+    *,
+    local_ip: str,
+    gateway_token: str,
+    whisper_model: str,
+    whisper_device: str,
+    whisper_compute_type: str,
+    gpu_label: str,
+    openclaw_port: int,
+    openclaw_token: str | None,
+) -> str:
+    """Render the ``.env`` file contents from :data:`_ENV_TEMPLATE`."""
+    oc_comment = (
+        "# Read from ~/.openclaw/openclaw.json → gateway.auth.token"
+        if openclaw_token
+        else "# Not found in ~/.openclaw/openclaw.json — set manually if needed"
+    )
+
+    return _ENV_TEMPLATE.format_map(
+        {
+            "local_ip": local_ip,
+            "gateway_token": gateway_token,
+            "whisper_model": whisper_model,
+            "whisper_device": whisper_device,
+            "whisper_compute_type": whisper_compute_type,
+            "gpu_label": gpu_label,
+            "openclaw_port": openclaw_port,
+            "oc_comment": oc_comment,
+            "oc_token_line": openclaw_token or "",
+        }
+    )
+
+
 # ---------------------------------------------------------------------------
 # CLI command
 # ---------------------------------------------------------------------------
@@ -274,12 +325,14 @@ def init_env(
 
     # --- Guard against overwriting -----------------------------------------------
     if env_path.exists() and not force:
-        console.print(
-            f"[bold yellow]⚠  {env_path} already exists.[/bold yellow]\n"
-            "  Run again with [bold]--force[/bold] to overwrite.",
-        )
+        typer.secho(f"⚠  {env_path} already exists.", fg=typer.colors.YELLOW, bold=True)
+        typer.echo("  Run again with --force to overwrite.")
         raise typer.Exit(code=1)
 
+    from rich.panel import Panel
+
+    console = _get_console()
+
     # --- GPU detection -----------------------------------------------------------
     gpu_name, vram_gb = _detect_gpu()
     has_gpu = gpu_name is not None
@@ -468,6 +521,7 @@ def _wait_for_port(
 
     Blocks indefinitely — the user can press Ctrl+C to abort.
     """
+    console = _get_console()
     start = time.monotonic()
     next_report = start + report_interval
     while True:
@@ -547,6 +601,7 @@ def _capture_vite_port(proc: subprocess.Popen[str], default: int, timeout: float
 @app.command()
 def stop() -> None:
     """Stop all G2 OpenClaw processes (gateway, Vite, simulator)."""
+    console = _get_console()
 
     targets = [
         ("OpenClaw daemon", ["openclaw.*daemon"]),
@@ -634,6 +689,9 @@ def push_config(
     API key, copy SOUL.md + preload) then restarts the OpenClaw daemon with
     the Azure api-version preload injected via NODE_OPTIONS.
     """
+    from rich.panel import Panel
+
+    console = _get_console()
 
     push_script = _PROJECT_ROOT / "scripts" / "push-openclaw-config.sh"
     if not push_script.is_file():
@@ -754,6 +812,9 @@ def launch(
     local_audio: bool = _local_audio_option,
 ) -> None:
     """Start the gateway, G2 dev server, and simulator together."""
+    from rich.panel import Panel
+
+    console = _get_console()
 
     # -- List audio devices shortcut -------------------------------------------
     if list_audio_devices:
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
 from dotenv import load_dotenv
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GatewayConfig:
     """Immutable gateway configuration."""
 
@@ -38,18 +40,23 @@ _LOOPBACK_HOSTS = {"127.0.0.1", "localhost", "::1"}
 logger = logging.getLogger(__name__)
 
 
-def _parse_int_env(name: str, default: str) -> int:
+def _parse_int_env(env: Mapping[str, str], name: str, default: str) -> int:
     """Parse an integer environment variable with a clear error on bad values."""
-    raw = os.environ.get(name, default)
+    raw = env.get(name, default)
     try:
         return int(raw)
     except ValueError as exc:
         raise ValueError(f"Environment variable {name} must be an integer, got {raw!r}") from exc
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> GatewayConfig:
     """Load gateway config from environment variables.
 
+    The result is cached for the lifetime of the process — the ``.env`` file
+    is read and the environment parsed only once.  Call
+    ``load_config.cache_clear()`` to force a reload (e.g. in tests).
+
     Reads a ``.env`` file if present, then builds a :class:`GatewayConfig` from:
 
     - ``GATEWAY_HOST`` (default ``"127.0.0.1"``)
@@ -67,18 +74,20 @@ def load_config() -> GatewayConfig:
     - ``G2_LOCAL_AUDIO`` (default ``false`` — capture audio from local mic instead of WebSocket)
     """
     load_dotenv(Path(__file__).resolve().parent.parent / ".env")
-
-    host = os.environ.get("GATEWAY_HOST", "127.0.0.1")
-    port = _parse_int_env("GATEWAY_PORT", "8765")
-    token = os.environ.get("GATEWAY_TOKEN")
-    whisper_model = os.environ.get("WHISPER_MODEL", "base.en")
-    whisper_device = os.environ.get("WHISPER_DEVICE", "cpu")
-    whisper_compute_type = os.environ.get("WHISPER_COMPUTE_TYPE", "int8")
-    openclaw_host = os.environ.get("OPENCLAW_HOST", "127.0.0.1")
-    openclaw_port = _parse_int_env("OPENCLAW_PORT", "18789")
-    openclaw_gateway_token = os.environ.get("OPENCLAW_GATEWAY_TOKEN")
-    agent_timeout = _parse_int_env("AGENT_TIMEOUT", "120")
-    auth_timeout_raw = os.environ.get("AUTH_TIMEOUT", "5.0")
+    # Snapshot after load_dotenv so every setting comes from one consistent view
+    env = os.environ.copy()
+
+    host = env.get("GATEWAY_HOST", "127.0.0.1")
+    port = _parse_int_env(env, "GATEWAY_PORT", "8765")
+    token = env.get("GATEWAY_TOKEN")
+    whisper_model = env.get("WHISPER_MODEL", "base.en")
+    whisper_device = env.get("WHISPER_DEVICE", "cpu")
+    whisper_compute_type = env.get("WHISPER_COMPUTE_TYPE", "int8")
+    openclaw_host = env.get("OPENCLAW_HOST", "127.0.0.1")
+    openclaw_port = _parse_int_env(env, "OPENCLAW_PORT", "18789")
+    openclaw_gateway_token = env.get("OPENCLAW_GATEWAY_TOKEN")
+    agent_timeout = _parse_int_env(env, "AGENT_TIMEOUT", "120")
+    auth_timeout_raw = env.get("AUTH_TIMEOUT", "5.0")
     try:
         auth_timeout = float(auth_timeout_raw)
     except ValueError as exc:
@@ -86,16 +95,16 @@ def load_config() -> GatewayConfig:
             f"Environment variable AUTH_TIMEOUT must be a number, got {auth_timeout_raw!r}"
         ) from exc
 
-    allowed_origins_raw = os.environ.get("ALLOWED_ORIGINS")
+    allowed_origins_raw = env.get("ALLOWED_ORIGINS")
     allowed_origins: list[str] | None = None
     if allowed_origins_raw:
         allowed_origins = [o.strip() for o in allowed_origins_raw.split(",") if o.strip()]
         if not allowed_origins:
             allowed_origins = None
 
-    local_audio = os.environ.get("G2_LOCAL_AUDIO", "false").lower() in ("true", "1", "yes")
-    history_limit = _parse_int_env("HISTORY_LIMIT", "10")
-    openclaw_agent_id = os.environ.get("OPENCLAW_AGENT_ID", "claw")
+    local_audio = env.get("G2_LOCAL_AUDIO", "false").lower() in ("true", "1", "yes")
+    history_limit = _parse_int_env(env, "HISTORY_LIMIT", "10")
+    openclaw_agent_id = env.get("OPENCLAW_AGENT_ID", "claw")
 
     cfg = GatewayConfig(
         gateway_host=host,
@@ -0,0 +1,45 @@
+"""JSON encode/decode for WebSocket frames.
+
+Uses ``orjson`` when it is installed (``uv sync --extra fast``) and falls
+back to the stdlib ``json`` module otherwise.  Both paths produce compact
+``str`` output so callers can send the result as a WebSocket text frame.
+
+``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``, so callers
+only need to catch :data:`JSONDecodeError`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover — exercised when the extra is absent
+    _HAVE_ORJSON = False
+else:
+    _HAVE_ORJSON = True
+
+
+if _HAVE_ORJSON:
+
+    def dumps(obj: Any) -> str:
+        """Serialize *obj* to a compact JSON string."""
+        encoded: bytes = orjson.dumps(obj)
+        return encoded.decode()
+
+    def loads(data: str | bytes) -> Any:
+        """Parse a JSON document from ``str`` or ``bytes``."""
+        return orjson.loads(data)
+
+else:
+
+    def dumps(obj: Any) -> str:
+        """Serialize *obj* to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    def loads(data: str | bytes) -> Any:
+        """Parse a JSON document from ``str`` or ``bytes``."""
+        return json.loads(data)
@@ -4,22 +4,28 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
+import itertools
 import logging
-import ssl
+import random
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import websockets
-from websockets import ClientConnection
-
+from gateway import json_codec
 from gateway.device_identity import (
     DeviceIdentity,
     build_device_connect_block,
     load_or_create_device_identity,
 )
 
+if TYPE_CHECKING:
+    # Type-only: ssl is loaded by websockets when a wss:// URL is opened, so
+    # keep it off this module's import path.
+    import ssl
+
+    from websockets import ClientConnection
+
 logger = logging.getLogger(__name__)
 
 # Defaults matching the JS GatewayClient SDK
@@ -32,6 +38,17 @@ _DEFAULT_SCOPES = ["operator.admin"]
 # Timeout for the server's ``connect.challenge`` event after WS open
 _CHALLENGE_TIMEOUT_S = 5.0
 
+# Reconnect backoff after a failed connect/auth attempt (doubles per failure)
+_RECONNECT_BACKOFF_INITIAL_S = 0.1
+_RECONNECT_BACKOFF_MAX_S = 5.0
+_RECONNECT_JITTER_S = 0.1
+
+# Pre-encoded ``agent`` request frame; only the string fields need JSON escaping
+_AGENT_REQ_TEMPLATE = (
+    '{"type":"req","id":"%d","method":"agent",'
+    '"params":{"message":%s,"sessionKey":%s,"idempotencyKey":"%s"}}'
+)
+
 # Sentinel used by _process_agent_event to signal stream end
 
 
@@ -41,11 +58,24 @@ class _StopSentinel:
 
 _STOP: _StopSentinel = _StopSentinel()
 
+# Read-only stand-in for a missing ``payload.data`` dict
+_EMPTY_DATA: dict[str, object] = {}
+
 
 class OpenClawError(Exception):
     """Raised when OpenClaw returns an error or communication fails."""
 
 
+def _encode_agent_request(req_id: int, text: str, session_key: str) -> str:
+    """Encode an ``agent`` request frame without building the nested dict."""
+    return _AGENT_REQ_TEMPLATE % (
+        req_id,
+        json_codec.dumps(text),
+        json_codec.dumps(session_key),
+        uuid.uuid4(),
+    )
+
+
 def _process_agent_event(msg: dict[str, object]) -> str | _StopSentinel | None:
     """Extract a delta string from an agent event message.
 
@@ -59,28 +89,28 @@ def _process_agent_event(msg: dict[str, object]) -> str | _StopSentinel | None:
     if msg.get("type") != "event" or msg.get("event") != "agent":
         return None
 
-    payload = msg.get("payload", {})
+    payload = msg.get("payload")
     if not isinstance(payload, dict):
         return None
 
     stream = payload.get("stream")
-    logger.info(
-        "_stream_deltas agent event: stream=%s payload=%s",
-        stream,
-        json.dumps(payload)[:200],
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "_stream_deltas agent event: stream=%s payload=%s",
+            stream,
+            json_codec.dumps(payload)[:200],
+        )
 
     # The real payload fields live inside payload.data (not top-level payload)
-    data = payload.get("data", {})
+    data = payload.get("data")
     if not isinstance(data, dict):
-        data = {}
+        data = _EMPTY_DATA
 
+    # Assistant deltas are by far the most frequent event — check them first
     if stream == "assistant":
-        delta = data.get("delta", "") or payload.get("delta", "")
-        if delta:
-            return str(delta)
-        return None
-    elif stream == "lifecycle":
+        delta = data.get("delta") or payload.get("delta")
+        return str(delta) if delta else None
+    if stream == "lifecycle":
         phase = data.get("phase") or payload.get("phase")
         if phase == "end":
             return _STOP
@@ -102,6 +132,26 @@ class OpenClawClient:
     scopes are silently cleared even though the connection succeeds.
     """
 
+    __slots__ = (
+        "_backoff",
+        "_client_id",
+        "_client_mode",
+        "_client_version",
+        "_connect_lock",
+        "_connect_params",
+        "_connected",
+        "_host",
+        "_id_counter",
+        "_identity",
+        "_next_id",
+        "_port",
+        "_role",
+        "_scopes",
+        "_ssl_context",
+        "_token",
+        "_ws",
+    )
+
     def __init__(
         self,
         host: str,
@@ -122,8 +172,12 @@ class OpenClawClient:
         self._token = token
         self._ssl_context = ssl_context
         self._ws: ClientConnection | None = None
-        self._next_id: int = 1
+        self._id_counter = itertools.count(1)
+        self._next_id: Callable[[], int] = self._id_counter.__next__
         self._connected: bool = False
+        self._connect_lock = asyncio.Lock()
+        # Delay before the next connect attempt; 0 after a successful connect
+        self._backoff: float = 0.0
 
         # Device identity — generate or load once
         self._identity = device_identity or load_or_create_device_identity(identity_path)
@@ -135,10 +189,21 @@ class OpenClawClient:
         self._client_mode = client_mode
         self._client_version = client_version
 
-    def _get_next_id(self) -> int:
-        rid = self._next_id
-        self._next_id += 1
-        return rid
+        # Static part of the connect params — only the signed device block
+        # (which covers the per-connection nonce) changes between handshakes.
+        self._connect_params: dict[str, object] = {
+            "minProtocol": 3,
+            "maxProtocol": 3,
+            "client": {
+                "id": self._client_id,
+                "version": self._client_version,
+                "platform": "python",
+                "mode": self._client_mode,
+            },
+            "auth": {"token": self._token},
+            "role": self._role,
+            "scopes": self._scopes,
+        }
 
     @property
     def url(self) -> str:
@@ -165,12 +230,38 @@ class OpenClawClient:
         if self._connected and self._ws is not None:
             return
 
+        # Serialise reconnects so concurrent callers share one handshake
+        async with self._connect_lock:
+            if self._connected and self._ws is not None:
+                return
+
+            if self._backoff > 0:
+                delay = self._backoff + random.uniform(0, _RECONNECT_JITTER_S)
+                logger.info("Waiting %.2fs before reconnecting to OpenClaw", delay)
+                await asyncio.sleep(delay)
+
+            try:
+                await self._connect_and_authenticate()
+            except OpenClawError:
+                self._backoff = min(
+                    max(self._backoff * 2, _RECONNECT_BACKOFF_INITIAL_S),
+                    _RECONNECT_BACKOFF_MAX_S,
+                )
+                raise
+            self._backoff = 0.0
+
+    async def _connect_and_authenticate(self) -> None:
+        """Open the WebSocket and run the challenge/connect handshake."""
+        # Deferred so importing this module does not load websockets
+        import websockets
+
         # Close any stale socket before reconnecting
         if self._ws is not None:
             await self._close_ws()
 
         # Reset request ID counter on new connection
-        self._next_id = 1
+        self._id_counter = itertools.count(1)
+        self._next_id = self._id_counter.__next__
 
         try:
             connect_kwargs: dict[str, object] = {}
@@ -184,11 +275,11 @@ class OpenClawClient:
         nonce: str | None = None
         try:
             raw = await asyncio.wait_for(self._ws.recv(), timeout=_CHALLENGE_TIMEOUT_S)
-            challenge = json.loads(raw)
+            challenge = json_codec.loads(raw)
             if challenge.get("type") == "event" and challenge.get("event") == "connect.challenge":
                 payload = challenge.get("payload", {})
                 nonce = payload.get("nonce") if isinstance(payload, dict) else None
-        except (TimeoutError, websockets.WebSocketException, json.JSONDecodeError) as exc:
+        except (TimeoutError, websockets.WebSocketException, json_codec.JSONDecodeError) as exc:
             await self._close_ws()
             raise OpenClawError(f"connect challenge failed: {exc}") from exc
 
@@ -209,31 +300,18 @@ class OpenClawClient:
             nonce=nonce,
         )
 
-        auth_id = self._get_next_id()
+        auth_id = self._next_id()
         auth_req = {
             "type": "req",
             "id": str(auth_id),
             "method": "connect",
-            "params": {
-                "minProtocol": 3,
-                "maxProtocol": 3,
-                "client": {
-                    "id": self._client_id,
-                    "version": self._client_version,
-                    "platform": "python",
-                    "mode": self._client_mode,
-                },
-                "auth": {"token": self._token},
-                "role": self._role,
-                "scopes": self._scopes,
-                "device": device_block,
-            },
+            "params": {**self._connect_params, "device": device_block},
         }
         try:
-            await self._ws.send(json.dumps(auth_req))
+            await self._ws.send(json_codec.dumps(auth_req))
             raw = await asyncio.wait_for(self._ws.recv(), timeout=10.0)
-            resp = json.loads(raw)
-        except (TimeoutError, websockets.WebSocketException, json.JSONDecodeError) as exc:
+            resp = json_codec.loads(raw)
+        except (TimeoutError, websockets.WebSocketException, json_codec.JSONDecodeError) as exc:
             await self._close_ws()
             raise OpenClawError(f"auth handshake failed: {exc}") from exc
 
@@ -258,24 +336,15 @@ class OpenClawClient:
 
         Raises OpenClawError on agent errors or communication failures.
         """
+        import websockets
+
         await self.ensure_connected()
         if self._ws is None:
             raise OpenClawError("not connected")
 
-        req_id = self._get_next_id()
-        agent_req = {
-            "type": "req",
-            "id": str(req_id),
-            "method": "agent",
-            "params": {
-                "message": text,
-                "sessionKey": session_key,
-                "idempotencyKey": str(uuid.uuid4()),
-            },
-        }
-
+        req_id = self._next_id()
         try:
-            await self._ws.send(json.dumps(agent_req))
+            await self._ws.send(_encode_agent_request(req_id, text, session_key))
         except websockets.WebSocketException as exc:
             self._connected = False
             raise OpenClawError(f"failed to send agent request: {exc}") from exc
@@ -284,25 +353,25 @@ class OpenClawClient:
         resp: dict[str, object] | None = None
         buffered_events: list[dict[str, object]] = []
         deadline = asyncio.get_event_loop().time() + 10.0
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
             while True:
                 remaining = deadline - asyncio.get_event_loop().time()
                 if remaining <= 0:
                     raise TimeoutError("timed out waiting for agent response")
                 raw = await asyncio.wait_for(self._ws.recv(), timeout=remaining)
-                msg = json.loads(raw)
+                msg = json_codec.loads(raw)
                 # Buffer events (they may contain agent deltas) — we only want the res frame
                 if msg.get("type") == "event":
-                    logger.info(
-                        "send_message buffered event: %s",
-                        json.dumps(msg)[:200],
-                    )
+                    if debug:
+                        logger.debug("send_message buffered event: %s", json_codec.dumps(msg)[:200])
                     buffered_events.append(msg)
                     continue
                 resp = msg
                 break
-            logger.info("agent res frame: %s", json.dumps(resp)[:500])
-        except (TimeoutError, websockets.WebSocketException, json.JSONDecodeError) as exc:
+            if debug:
+                logger.debug("agent res frame: %s", json_codec.dumps(resp)[:500])
+        except (TimeoutError, websockets.WebSocketException, json_codec.JSONDecodeError) as exc:
             self._connected = False
             raise OpenClawError(f"no response to agent request: {exc}") from exc
 
@@ -323,10 +392,15 @@ class OpenClawClient:
             logger.info("_stream_deltas: starting (buffered=%d)", len(pre_buffered))
             _clean_exit = False
             try:
+                loads = json_codec.loads
+                process = _process_agent_event
+                debug = logger.isEnabledFor(logging.DEBUG)
+
                 # First, drain any events that arrived before the res frame
                 for msg in pre_buffered:
-                    logger.info("_stream_deltas buffered: %s", json.dumps(msg)[:200])
-                    result = _process_agent_event(msg)
+                    if debug:
+                        logger.debug("_stream_deltas buffered: %s", json_codec.dumps(msg)[:200])
+                    result = process(msg)
                     if isinstance(result, _StopSentinel):
                         _clean_exit = True
                         return
@@ -336,14 +410,14 @@ class OpenClawClient:
                 # Then continue reading live from the WebSocket
                 async for raw_msg in self._ws:
                     try:
-                        msg = json.loads(raw_msg)
-                    except json.JSONDecodeError:
+                        msg = loads(raw_msg)
+                    except json_codec.JSONDecodeError:
                         logger.warning("Malformed OpenClaw message: %s", raw_msg[:100])
                         continue
 
-                    logger.info("_stream_deltas raw: %s", json.dumps(msg)[:200])
-                    logger.info("wire recv: %s", json.dumps(msg)[:300])
-                    result = _process_agent_event(msg)
+                    if debug:
+                        logger.debug("wire recv: %s", json_codec.dumps(msg)[:300])
+                    result = process(msg)
                     if isinstance(result, _StopSentinel):
                         _clean_exit = True
                         return
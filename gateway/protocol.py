@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import sys
+from collections.abc import Callable
 from enum import StrEnum
 from typing import Any, Literal, NotRequired, TypedDict
 
+from gateway import json_codec
+
 # ---------------------------------------------------------------------------
 # Status states & error codes
 # ---------------------------------------------------------------------------
@@ -196,13 +199,56 @@ def _check_fields(data: dict[str, Any], required: list[str], frame_type: str) ->
         if field not in data:
             raise ProtocolError(f"Frame type '{frame_type}' missing required field '{field}'")
     for field, value in data.items():
-        if field == "type":
-            continue
-        expected_type = _FIELD_TYPES.get(field)
+        expected_type = _FIELD_TYPES.get(field)  # None for 'type' and unknown extras
         if expected_type is not None and not isinstance(value, expected_type):
-            raise ProtocolError(
-                f"Field '{field}' must be {expected_type.__name__}, got {type(value).__name__}"
-            )
+            raise _type_error(field, expected_type, value)
+
+
+def _type_error(field: str, expected_type: type, value: object) -> ProtocolError:
+    return ProtocolError(
+        f"Field '{field}' must be {expected_type.__name__}, got {type(value).__name__}"
+    )
+
+
+def _compile_validator(frame_type: str, required: list[str]) -> Callable[[dict[str, Any]], None]:
+    """Specialize the field checks for one frame type, once at import.
+
+    Required fields and their types are resolved up front, so a frame carrying
+    exactly its required fields is checked without any ``_FIELD_TYPES``
+    lookups.  Frames with optional or extra fields fall back to
+    ``_check_fields``.
+    """
+    checks = tuple((field, _FIELD_TYPES.get(field)) for field in required)
+    exact_len = len(required) + 1  # + 'type'
+
+    def validate(data: dict[str, Any]) -> None:
+        if len(data) != exact_len:
+            _check_fields(data, required, frame_type)
+            return
+        for field, expected_type in checks:
+            if field not in data:
+                # Same length but a required key is missing — report it as usual
+                _check_fields(data, required, frame_type)
+                return
+            if expected_type is not None and not isinstance(data[field], expected_type):
+                raise _type_error(field, expected_type, data[field])
+
+    return validate
+
+
+# Inbound type → (interned type string, validator).  Parsed frames get the
+# interned string back in their "type" slot, so later dispatch-table lookups
+# match by identity instead of comparing characters.
+_INBOUND_VALIDATORS = {
+    t: (sys.intern(t), _compile_validator(t, req)) for t, req in _INBOUND_FIELDS.items()
+}
+_OUTBOUND_VALIDATORS = {t: _compile_validator(t, req) for t, req in _OUTBOUND_FIELDS.items()}
+
+# Field-less inbound frames exactly as the phone's JSON.stringify emits them;
+# these are answered without a JSON parse.
+_LITERAL_INBOUND: dict[str, str] = {
+    json_codec.dumps({"type": t}): sys.intern(t) for t, req in _INBOUND_FIELDS.items() if not req
+}
 
 
 def parse_text_frame(raw: str) -> dict[str, Any]:
@@ -212,9 +258,13 @@ def parse_text_frame(raw: str) -> dict[str, Any]:
     Raises ``ProtocolError`` on invalid JSON, unknown/outbound type, or
     missing/mistyped fields.
     """
+    literal_type = _LITERAL_INBOUND.get(raw)
+    if literal_type is not None:
+        return {"type": literal_type}
+
     try:
-        data = json.loads(raw)
-    except (json.JSONDecodeError, TypeError) as exc:
+        data = json_codec.loads(raw)
+    except (json_codec.JSONDecodeError, TypeError) as exc:
         raise ProtocolError(f"Invalid JSON: {exc}") from exc
 
     if not isinstance(data, dict):
@@ -224,11 +274,13 @@ def parse_text_frame(raw: str) -> dict[str, Any]:
     if frame_type is None:
         raise ProtocolError("Frame missing 'type' field")
 
-    required = _INBOUND_FIELDS.get(frame_type)
-    if required is None:
+    entry = _INBOUND_VALIDATORS.get(frame_type)
+    if entry is None:
         raise ProtocolError(f"Unknown frame type: {frame_type}")
 
-    _check_fields(data, required, frame_type)
+    interned_type, validate = entry
+    validate(data)
+    data["type"] = interned_type
 
     if frame_type == "text":
         msg = data.get("message", "")
@@ -252,13 +304,16 @@ def validate_outbound(frame: dict[str, Any]) -> None:
     if frame_type is None:
         raise ProtocolError("Frame missing 'type' field")
 
-    required = _OUTBOUND_FIELDS.get(frame_type)
-    if required is None:
+    validate = _OUTBOUND_VALIDATORS.get(frame_type)
+    if validate is None:
         raise ProtocolError(f"Unknown outbound frame type: {frame_type}")
 
-    _check_fields(frame, required, frame_type)
+    validate(frame)
 
 
 def serialize(frame: dict[str, Any]) -> str:
-    """Serialize a frame dict to a JSON string."""
-    return json.dumps(frame, separators=(",", ":"))
+    """Serialize a frame dict to a compact JSON string.
+
+    Returns ``str`` (not ``bytes``) so websockets sends it as a text frame.
+    """
+    return json_codec.dumps(frame)
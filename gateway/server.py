@@ -5,8 +5,8 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import hmac
-import json
 import logging
+import socket
 import sys
 import time as _time_module
 import uuid
@@ -15,19 +15,20 @@ from dataclasses import dataclass, field
 from enum import StrEnum
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Any, Protocol
-from urllib.parse import parse_qs, urlparse
+from typing import Any, ClassVar, Protocol
 
 import websockets
 import websockets.http11
 from websockets import ServerConnection
 
+from gateway import json_codec
 from gateway.audio_buffer import AudioBuffer, BufferOverflow
 from gateway.config import GatewayConfig, load_config
 from gateway.openclaw_client import OpenClawClient, OpenClawError
 from gateway.protocol import (
     ErrorCode,
     ProtocolError,
+    StatusState,
     parse_text_frame,
     serialize,
     validate_outbound,
@@ -48,6 +49,82 @@ _MAX_RECORDING_SECONDS = 90
 _BUFFER_MAX_CHARS = 200_000  # ~200 KB text limit
 _BUFFER_TTL_SECONDS = 300  # discard after 5 minutes
 
+_DELTA_COALESCE_SECONDS = 0.005  # max added latency before pending deltas are sent
+_DELTA_COALESCE_MAX_CHARS = 4_096  # send early once this much text is pending
+
+# Binary auth frame: this magic byte followed by the raw UTF-8 token
+_AUTH_MAGIC = b"\x01"
+
+
+def _prebuilt(frame: dict[str, Any]) -> str:
+    """Validate and serialize a constant outbound frame once, at import."""
+    validate_outbound(frame)
+    return serialize(frame)
+
+
+# Canned frames sent on every state change — encoded once, sent via send_raw()
+_SESSION_STATUSES: tuple[StatusState, ...] = (
+    "idle",
+    "recording",
+    "transcribing",
+    "thinking",
+    "streaming",
+)
+_STATUS_FRAMES: dict[StatusState, str] = {
+    state: _prebuilt({"type": "status", "status": state}) for state in _SESSION_STATUSES
+}
+_END_FRAME = _prebuilt({"type": "end"})
+_CONNECTED_FRAME = _prebuilt({"type": "connected", "version": "1.0"})
+
+_ASSISTANT_PREFIX = _prebuilt({"type": "assistant", "delta": ""})[:-3]
+
+
+def _encode_assistant_delta(delta: str) -> str:
+    """Serialize an assistant frame by splicing *delta* into a fixed envelope.
+
+    Produces the same text as ``serialize({"type": "assistant", "delta": delta})``
+    without building or validating a dict per frame.
+    """
+    return _ASSISTANT_PREFIX + json_codec.dumps(delta) + "}"
+
+
+_ERROR_PREFIX = '{"type":"error","detail":'
+_ERROR_SUFFIXES: dict[ErrorCode, str] = {
+    code: ',"code":' + json_codec.dumps(code.value) + "}" for code in ErrorCode
+}
+
+
+def _encode_error(detail: str, code: ErrorCode) -> str:
+    """Serialize an error frame from per-code templates; only *detail* is encoded."""
+    return _ERROR_PREFIX + json_codec.dumps(detail) + _ERROR_SUFFIXES[code]
+
+
+def _set_tcp_nodelay(ws: ServerConnection) -> None:
+    """Disable Nagle on the connection's socket so small frames go out immediately.
+
+    asyncio's TCP transports already do this by default; setting it here keeps
+    the guarantee explicit regardless of the event loop in use.
+    """
+    sock = ws.transport.get_extra_info("socket")
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError:
+        logger.debug("Could not set TCP_NODELAY", exc_info=True)
+
+
+def _has_query_token(path: str) -> bool:
+    """Return whether *path* carries a non-empty ``token`` query parameter."""
+    _, sep, query = path.partition("?")
+    if not sep:
+        return False
+    for part in query.split("&"):
+        key, _, value = part.partition("=")
+        if key == "token" and value:
+            return True
+    return False
+
 
 def _generate_session_key() -> str:
     """Generate a new unique session key."""
@@ -93,8 +170,120 @@ class InflightBuffer:
         return (_time_module.monotonic() - self.created_at) > _BUFFER_TTL_SECONDS
 
 
+class _DeltaBatcher:
+    """Coalesces assistant deltas that arrive within a short window into one frame.
+
+    ``add()`` never blocks; pending deltas are sent at most ``window`` seconds
+    after the first one arrived, or as soon as ``max_chars`` of text is
+    pending.  ``flush()`` must be awaited before any frame
+    that has to follow the deltas (``end``, errors).  Used as an async context
+    manager it flushes on clean exit, best-effort flushes on error, and drops
+    anything pending on cancellation.
+
+    When ``send_raw`` is given, batches are encoded with
+    :func:`_encode_assistant_delta` and sent pre-serialized instead of going
+    through ``send_frame``.
+    """
+
+    def __init__(
+        self,
+        send_frame: Callable[[dict[str, Any]], Awaitable[None]],
+        window: float = _DELTA_COALESCE_SECONDS,
+        *,
+        send_raw: Callable[[str], Awaitable[None]] | None = None,
+        max_chars: int = _DELTA_COALESCE_MAX_CHARS,
+    ) -> None:
+        self._send_frame = send_frame
+        self._send_raw = send_raw
+        self._window = window
+        self._max_chars = max_chars
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._error: Exception | None = None
+
+    async def __aenter__(self) -> _DeltaBatcher:
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        try:
+            if exc_type is None:
+                await self.flush()
+            elif issubclass(exc_type, Exception):
+                # Deliver what already arrived before the caller reports the error
+                with contextlib.suppress(Exception):
+                    await self.flush()
+        finally:
+            self.discard()
+
+    def add(self, delta: str) -> None:
+        self._pending.append(delta)
+        self._pending_chars += len(delta)
+        if self._pending_chars >= self._max_chars:
+            # Large enough to send now rather than wait out the window
+            if self._timer is not None:
+                self._timer.cancel()
+            self._on_timer()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._window, self._on_timer)
+
+    async def flush(self) -> None:
+        """Send pending deltas now; re-raise any error from a timed send."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._task is not None:
+            await self._task
+            self._task = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        await self._send_pending()
+
+    def discard(self) -> None:
+        """Drop pending deltas and cancel any scheduled or in-flight send."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._pending.clear()
+        self._pending_chars = 0
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        if self._task is not None and not self._task.done():
+            # Previous send still in flight — keep frame order by waiting for it
+            self._timer = asyncio.get_running_loop().call_later(self._window, self._on_timer)
+            return
+        self._task = asyncio.create_task(self._send_pending_from_timer())
+
+    async def _send_pending_from_timer(self) -> None:
+        try:
+            await self._send_pending()
+        except Exception as exc:
+            self._error = exc
+
+    async def _send_pending(self) -> None:
+        if not self._pending:
+            return
+        delta = "".join(self._pending)
+        self._pending.clear()
+        self._pending_chars = 0
+        if self._send_raw is not None:
+            await self._send_raw(_encode_assistant_delta(delta))
+        else:
+            await self._send_frame({"type": "assistant", "delta": delta})
+
+
 class SessionState(StrEnum):
-    """Gateway session processing states."""
+    """Gateway session processing states.
+
+    ``GatewaySession._state`` always holds a member, never a bare string, so
+    per-frame checks compare by identity.
+    """
 
     IDLE = "idle"
     RECORDING = "recording"
@@ -126,8 +315,9 @@ class MockResponseHandler:
     ) -> None:
         await asyncio.sleep(0.1)
         await send_frame({"type": "status", "status": "streaming"})
-        for delta in _MOCK_DELTAS:
-            await send_frame({"type": "assistant", "delta": delta})
+        async with _DeltaBatcher(send_frame) as batcher:
+            for delta in _MOCK_DELTAS:
+                batcher.add(delta)
         await send_frame({"type": "end"})
 
     async def close(self) -> None:
@@ -158,9 +348,10 @@ class OpenClawResponseHandler:
 
         await send_frame({"type": "status", "status": "streaming"})
 
-        async for delta in stream:
-            logger.debug("OpenClaw delta: %s", delta[:50] if delta else "")
-            await send_frame({"type": "assistant", "delta": delta})
+        async with _DeltaBatcher(send_frame) as batcher:
+            async for delta in stream:
+                logger.debug("OpenClaw delta: %s", delta[:50] if delta else "")
+                batcher.add(delta)
 
         await send_frame({"type": "end"})
 
@@ -172,6 +363,29 @@ class OpenClawResponseHandler:
 class GatewaySession:
     """Manages a single WebSocket connection."""
 
+    # Inbound frame type → (required session state or None, INVALID_STATE detail,
+    # handler method name).  Handlers all take the parsed frame.
+    _DISPATCH: ClassVar[dict[str, tuple[SessionState | None, str, str]]] = {
+        "text": (SessionState.IDLE, "Cannot process text while session is busy", "_handle_text"),
+        "pong": (None, "", "_handle_pong"),
+        "start_audio": (
+            SessionState.IDLE,
+            "Cannot start audio while session is busy",
+            "_handle_start_audio",
+        ),
+        "stop_audio": (
+            SessionState.RECORDING,
+            "Cannot stop audio — not recording",
+            "_handle_stop_audio",
+        ),
+        "status_request": (None, "", "_handle_status_request"),
+        "reset_session": (
+            SessionState.IDLE,
+            "Cannot reset session while busy",
+            "_handle_reset_session",
+        ),
+    }
+
     def __init__(
         self,
         ws: ServerConnection,
@@ -190,8 +404,13 @@ class GatewaySession:
         self._transcriber = transcriber
         self._audio_buffer: AudioBuffer | None = None
         self._timeout = timeout
-        self._recording_start: float | None = None
+        # One-shot M-4 recording cap; armed by start_audio, cancelled when recording ends
+        self._recording_timer: asyncio.TimerHandle | None = None
+        self._recording_timeout_task: asyncio.Task[None] | None = None
+        self._recording_generation = 0
         self._local_audio = local_audio
+        # Binary frames dropped since the last start_audio; only the first is a WARNING
+        self._dropped_binary_frames = 0
         self._local_stream: Any = None  # sounddevice.InputStream when active
         self._history_limit = history_limit
         self._session_key = session_key
@@ -205,6 +424,21 @@ class GatewaySession:
         validate_outbound(frame)
         await self.ws.send(serialize(frame))
 
+    async def send_raw(self, data: str) -> None:
+        """Send an already-validated, pre-serialized frame."""
+        await self.ws.send(data)
+
+    async def send_trusted(self, frame: dict[str, Any]) -> None:
+        """Serialize and send a frame built by the gateway itself, skipping validation.
+
+        ``send_frame`` stays the entry point for ``ResponseHandler`` output.
+        """
+        await self.ws.send(serialize(frame))
+
+    async def send_error(self, detail: str, code: ErrorCode) -> None:
+        """Send a gateway-built error frame without validation."""
+        await self.ws.send(_encode_error(detail, code))
+
     def _stop_local_stream(self) -> None:
         """Stop and close the local sounddevice stream if active."""
         if self._local_stream is not None:
@@ -227,7 +461,7 @@ class GatewaySession:
                 agent_id=self._agent_id,
                 limit=self._history_limit,
             )
-            await self.send_frame(
+            await self.send_trusted(
                 {
                     "type": "history",
                     "entries": [
@@ -267,27 +501,32 @@ class GatewaySession:
                 frame["phase"] = phase
         return frame
 
-    async def _handle_status_request(self) -> None:
+    async def _handle_status_request(self, frame: dict[str, Any] | None = None) -> None:
         """Respond with current status and optional task metadata."""
         frame = self._build_status_frame(include_metadata=True)
-        await self.send_frame(frame)
+        await self.send_trusted(frame)
 
     async def handle(self) -> None:
-        connected_frame: dict[str, Any] = {"type": "connected", "version": "1.0"}
         meta = resolve_session(
             session_key=self._session_key,
             agent_id=self._agent_id,
         )
-        if meta is not None:
-            connected_frame["sessionId"] = meta.session_id
-            connected_frame["sessionKey"] = meta.session_key
+        if meta is None:
+            await self.send_raw(_CONNECTED_FRAME)
+        else:
+            connected_frame: dict[str, Any] = {
+                "type": "connected",
+                "version": "1.0",
+                "sessionId": meta.session_id,
+                "sessionKey": meta.session_key,
+            }
             if meta.updated_at:
                 connected_frame["sessionStartedAt"] = meta.updated_at
-        await self.send_frame(connected_frame)
+            await self.send_trusted(connected_frame)
 
         await self._send_history()
 
-        await self.send_frame({"type": "status", "status": "idle"})
+        await self.send_raw(_STATUS_FRAMES["idle"])
 
         # Allow server to replay buffered response
         if self._on_ready:
@@ -301,77 +540,30 @@ class GatewaySession:
             try:
                 frame = parse_text_frame(message)
             except ProtocolError as exc:
-                await self.send_frame(
-                    {
-                        "type": "error",
-                        "detail": str(exc),
-                        "code": ErrorCode.INVALID_FRAME,
-                    }
-                )
+                await self.send_error(str(exc), ErrorCode.INVALID_FRAME)
                 continue
 
             await self._dispatch(frame)
 
     async def _dispatch(self, frame: dict[str, Any]) -> None:
         frame_type = frame["type"]
+        entry = self._DISPATCH.get(frame_type)
+        if entry is None:
+            await self.send_error(f"Unhandled frame type: {frame_type}", ErrorCode.INVALID_FRAME)
+            return
 
-        if frame_type == "text":
-            if self._state != SessionState.IDLE:
-                await self.send_frame(
-                    {
-                        "type": "error",
-                        "detail": "Cannot process text while session is busy",
-                        "code": ErrorCode.INVALID_STATE,
-                    }
-                )
-                return
-            await self._handle_text(frame)
-        elif frame_type == "pong":
-            logger.info("Received pong")
-        elif frame_type == "start_audio":
-            if self._state != SessionState.IDLE:
-                await self.send_frame(
-                    {
-                        "type": "error",
-                        "detail": "Cannot start audio while session is busy",
-                        "code": ErrorCode.INVALID_STATE,
-                    }
-                )
-                return
-            await self._handle_start_audio(frame)
-        elif frame_type == "stop_audio":
-            if self._state != SessionState.RECORDING:
-                await self.send_frame(
-                    {
-                        "type": "error",
-                        "detail": "Cannot stop audio — not recording",
-                        "code": ErrorCode.INVALID_STATE,
-                    }
-                )
-                return
-            await self._handle_stop_audio(frame)
-        elif frame_type == "status_request":
-            await self._handle_status_request()
-        elif frame_type == "reset_session":
-            if self._state != SessionState.IDLE:
-                await self.send_frame(
-                    {
-                        "type": "error",
-                        "detail": "Cannot reset session while busy",
-                        "code": ErrorCode.INVALID_STATE,
-                    }
-                )
-                return
-            if self._server is not None:
-                await self._server.reset_session("user_request")
-        else:
-            await self.send_frame(
-                {
-                    "type": "error",
-                    "detail": f"Unhandled frame type: {frame_type}",
-                    "code": ErrorCode.INVALID_FRAME,
-                }
-            )
+        required_state, busy_detail, method_name = entry
+        if required_state is not None and self._state is not required_state:
+            await self.send_error(busy_detail, ErrorCode.INVALID_STATE)
+            return
+        await getattr(self, method_name)(frame)
+
+    async def _handle_pong(self, frame: dict[str, Any]) -> None:
+        logger.info("Received pong")
+
+    async def _handle_reset_session(self, frame: dict[str, Any]) -> None:
+        if self._server is not None:
+            await self._server.reset_session("user_request")
 
     async def _handle_binary(self, data: bytes) -> None:
         """Handle binary frame (PCM audio data)."""
@@ -379,64 +571,97 @@ class GatewaySession:
             # In local-audio mode the mic stream feeds the buffer directly —
             # silently discard binary frames from the WebSocket.
             return
-        if self._state != SessionState.RECORDING:
-            logger.warning("Binary frame received while not recording — ignoring")
+        if self._state is not SessionState.RECORDING:
+            self._log_binary_drop("not recording")
             return
         if self._audio_buffer is None:
-            logger.warning("Binary frame received but no audio buffer — ignoring")
+            self._log_binary_drop("no audio buffer")
             return
-        # M-4: recording timeout
-        if self._recording_start is not None:
-            elapsed = asyncio.get_running_loop().time() - self._recording_start
-            if elapsed > _MAX_RECORDING_SECONDS:
-                logger.warning(
-                    "Recording exceeded %ss limit — auto-stopping", _MAX_RECORDING_SECONDS
-                )
-                self._audio_buffer.reset()
-                self._recording_start = None
-                self._state = SessionState.IDLE
-                self._current_question = None
-                self._task_start = None
-                await self.send_frame(
-                    {
-                        "type": "error",
-                        "detail": f"Recording exceeded {_MAX_RECORDING_SECONDS}s limit",
-                        "code": ErrorCode.BUFFER_OVERFLOW,
-                    }
-                )
-                await self.send_frame({"type": "status", "status": "idle"})
-                return
+        # The audio-length cap lives in AudioBuffer.append and the wall-clock
+        # cap (M-4) on a loop timer, so this is the only check per PCM frame.
         try:
             self._audio_buffer.append(data)
         except BufferOverflow as exc:
             logger.error("Audio buffer overflow: %s", exc)
+            self._cancel_recording_timeout()
             self._audio_buffer.reset()
-            self._state = SessionState.IDLE
-            self._current_question = None
-            self._task_start = None
-            await self.send_frame(
-                {
-                    "type": "error",
-                    "detail": "Audio buffer overflow",
-                    "code": ErrorCode.BUFFER_OVERFLOW,
-                }
-            )
-            await self.send_frame({"type": "status", "status": "idle"})
+            await self._send_error_and_idle("Audio buffer overflow", ErrorCode.BUFFER_OVERFLOW)
         except ValueError as exc:
             logger.error("Invalid PCM data: %s", exc)
+            self._cancel_recording_timeout()
             if self._audio_buffer is not None:
                 self._audio_buffer.reset()
-            self._state = SessionState.IDLE
-            self._current_question = None
-            self._task_start = None
-            await self.send_frame(
-                {
-                    "type": "error",
-                    "detail": "Invalid audio data format",
-                    "code": ErrorCode.INVALID_FRAME,
-                }
+            await self._send_error_and_idle("Invalid audio data format", ErrorCode.INVALID_FRAME)
+
+    async def _send_error_and_idle(self, detail: str, code: ErrorCode) -> None:
+        """Abort the current request: return to IDLE, send an error, then idle status.
+
+        Both frames skip ``validate_outbound``.
+        """
+        self._state = SessionState.IDLE
+        self._current_question = None
+        self._task_start = None
+        await self.send_error(detail, code)
+        await self.send_raw(_STATUS_FRAMES["idle"])
+
+    def _log_binary_drop(self, reason: str) -> None:
+        """Log a dropped binary frame without flooding the log.
+
+        A phone keeps streaming PCM for a moment after recording ends, so
+        only the first drop is a WARNING and the rest go to DEBUG.
+        """
+        self._dropped_binary_frames += 1
+        level = logging.WARNING if self._dropped_binary_frames == 1 else logging.DEBUG
+        if logger.isEnabledFor(level):
+            logger.log(
+                level,
+                "Binary frame received but %s — ignoring (%d dropped)",
+                reason,
+                self._dropped_binary_frames,
             )
-            await self.send_frame({"type": "status", "status": "idle"})
+
+    def _arm_recording_timeout(self) -> None:
+        """Auto-stop the current recording after ``_MAX_RECORDING_SECONDS`` (M-4)."""
+        self._cancel_recording_timeout()
+        self._recording_timer = asyncio.get_running_loop().call_later(
+            _MAX_RECORDING_SECONDS, self._on_recording_timeout, self._recording_generation
+        )
+
+    def _cancel_recording_timeout(self) -> None:
+        if self._recording_timer is not None:
+            self._recording_timer.cancel()
+            self._recording_timer = None
+
+    def _cancel_recording_timeout_task(self) -> None:
+        if self._recording_timeout_task is not None and not self._recording_timeout_task.done():
+            self._recording_timeout_task.cancel()
+        self._recording_timeout_task = None
+
+    def _is_current_recording(self, generation: int) -> bool:
+        # Each start_audio bumps the generation, so a stale timer never matches
+        return self._state is SessionState.RECORDING and self._recording_generation == generation
+
+    def _on_recording_timeout(self, generation: int) -> None:
+        self._recording_timer = None
+        if not self._is_current_recording(generation):
+            return
+        self._recording_timeout_task = asyncio.create_task(
+            self._stop_recording_on_timeout(generation)
+        )
+
+    async def _stop_recording_on_timeout(self, generation: int) -> None:
+        # Re-check: a stop_audio handled after the timer fired already owns the recording
+        if not self._is_current_recording(generation):
+            return
+        logger.warning("Recording exceeded %ss limit — auto-stopping", _MAX_RECORDING_SECONDS)
+        if self._audio_buffer is not None:
+            self._audio_buffer.reset()
+        try:
+            await self._send_error_and_idle(
+                f"Recording exceeded {_MAX_RECORDING_SECONDS}s limit", ErrorCode.BUFFER_OVERFLOW
+            )
+        except Exception:
+            logger.debug("Failed to send recording timeout frames", exc_info=True)
 
     async def _handle_start_audio(self, frame: dict[str, Any]) -> None:
         """Start recording audio after validating format parameters."""
@@ -445,32 +670,19 @@ class GatewaySession:
         sample_width = frame["sampleWidth"]
 
         if sample_width != 2:
-            await self.send_frame(
-                {
-                    "type": "error",
-                    "detail": (
-                        f"Unsupported sample width: {sample_width} (only 16-bit PCM supported)"
-                    ),
-                    "code": ErrorCode.INVALID_FRAME,
-                }
+            await self.send_error(
+                f"Unsupported sample width: {sample_width} (only 16-bit PCM supported)",
+                ErrorCode.INVALID_FRAME,
             )
             return
         if not (8_000 <= sample_rate <= 48_000):
-            await self.send_frame(
-                {
-                    "type": "error",
-                    "detail": f"Invalid sample rate: {sample_rate} (expected 8000-48000)",
-                    "code": ErrorCode.INVALID_FRAME,
-                }
+            await self.send_error(
+                f"Invalid sample rate: {sample_rate} (expected 8000-48000)", ErrorCode.INVALID_FRAME
             )
             return
         if channels not in (1, 2):
-            await self.send_frame(
-                {
-                    "type": "error",
-                    "detail": f"Invalid channels: {channels} (must be 1 or 2)",
-                    "code": ErrorCode.INVALID_FRAME,
-                }
+            await self.send_error(
+                f"Invalid channels: {channels} (must be 1 or 2)", ErrorCode.INVALID_FRAME
             )
             return
 
@@ -480,13 +692,12 @@ class GatewaySession:
             channels,
             sample_width,
         )
-        self._audio_buffer = AudioBuffer(
-            sample_rate=sample_rate,
-            channels=channels,
-            sample_width=sample_width,
-        )
-        self._recording_start = asyncio.get_running_loop().time()
+        self._prepare_audio_buffer(sample_rate, channels, sample_width)
+        self._recording_generation += 1
         self._state = SessionState.RECORDING
+        self._dropped_binary_frames = 0
+        if not self._local_audio:
+            self._arm_recording_timeout()
 
         # Start local mic capture when --local-audio is enabled
         if self._local_audio:
@@ -517,7 +728,21 @@ class GatewaySession:
                 logger.exception("Failed to start local audio capture")
                 self._local_stream = None
 
-        await self.send_frame({"type": "status", "status": "recording"})
+        await self.send_raw(_STATUS_FRAMES["recording"])
+
+    def _prepare_audio_buffer(
+        self, sample_rate: int, channels: int, sample_width: int
+    ) -> AudioBuffer:
+        """Reuse the session's audio buffer for a new recording, creating it once."""
+        if self._audio_buffer is None:
+            self._audio_buffer = AudioBuffer(
+                sample_rate=sample_rate,
+                channels=channels,
+                sample_width=sample_width,
+            )
+        else:
+            self._audio_buffer.reconfigure(sample_rate, channels, sample_width)
+        return self._audio_buffer
 
     async def _handle_stop_audio(self, frame: dict[str, Any] | None = None) -> None:
         """Stop recording and run transcription pipeline."""
@@ -526,8 +751,8 @@ class GatewaySession:
 
         self._task_start = asyncio.get_running_loop().time()
         self._state = SessionState.TRANSCRIBING
-        self._recording_start = None
-        await self.send_frame({"type": "status", "status": "transcribing"})
+        self._cancel_recording_timeout()
+        await self.send_raw(_STATUS_FRAMES["transcribing"])
 
         # HIL mode: synthesize text → fill buffer for transcription
         hil_text = frame.get("hilText") if frame else None
@@ -537,68 +762,38 @@ class GatewaySession:
 
                 logger.info("HIL TTS: synthesizing %d chars", len(hil_text))
                 pcm_bytes, tts_rate = await synthesize_pcm(hil_text)
-                # Create a fresh buffer and fill it with the TTS audio
-                from gateway.audio_buffer import AudioBuffer
-
-                self._audio_buffer = AudioBuffer(
-                    sample_rate=tts_rate,
-                    channels=1,
-                    sample_width=2,
-                )
-                self._audio_buffer.append(pcm_bytes)
+                # Refill the session buffer with the TTS audio
+                hil_buf = self._prepare_audio_buffer(tts_rate, 1, 2)
+                hil_buf.append(pcm_bytes)
                 logger.info(
                     "HIL TTS: buffer filled (%.1fs of audio)",
-                    self._audio_buffer.duration_seconds,
+                    hil_buf.duration_seconds,
                 )
             except Exception:
                 logger.exception("HIL TTS synthesis failed")
-                self._state = SessionState.IDLE
-                self._current_question = None
-                self._task_start = None
-                await self.send_frame(
-                    {
-                        "type": "error",
-                        "detail": "TTS synthesis failed",
-                        "code": ErrorCode.INTERNAL_ERROR,
-                    }
-                )
-                await self.send_frame({"type": "status", "status": "idle"})
+                await self._send_error_and_idle("TTS synthesis failed", ErrorCode.INTERNAL_ERROR)
                 return
 
         buf = self._audio_buffer
-        self._audio_buffer = None
 
         if buf is None or buf.is_empty:
-            self._state = SessionState.IDLE
-            self._current_question = None
-            self._task_start = None
-            await self.send_frame(
-                {
-                    "type": "error",
-                    "detail": "No audio data received",
-                    "code": ErrorCode.TRANSCRIPTION_FAILED,
-                }
+            await self._send_error_and_idle(
+                "No audio data received", ErrorCode.TRANSCRIPTION_FAILED
             )
-            await self.send_frame({"type": "status", "status": "idle"})
             return
 
         if self._transcriber is None:
             logger.warning("No transcriber configured — skipping transcription")
-            self._state = SessionState.IDLE
-            self._current_question = None
-            self._task_start = None
-            await self.send_frame(
-                {
-                    "type": "error",
-                    "detail": "Transcriber not configured",
-                    "code": ErrorCode.TRANSCRIPTION_FAILED,
-                }
+            buf.reset()
+            await self._send_error_and_idle(
+                "Transcriber not configured", ErrorCode.TRANSCRIPTION_FAILED
             )
-            await self.send_frame({"type": "status", "status": "idle"})
             return
 
         try:
             audio_array = buf.to_numpy()
+            # to_numpy copies, so the buffer is free for the next recording
+            buf.reset()
             try:
                 import numpy as _np
 
@@ -616,83 +811,46 @@ class GatewaySession:
 
                 _diag_path = f"/tmp/gateway_audio_{int(_time.time())}.wav"
                 with _wave.open(_diag_path, "wb") as _wf:
-                    _wf.setnchannels(buf.channels)
+                    _wf.setnchannels(1)  # to_numpy() downmixes to mono
                     _wf.setsampwidth(buf.sample_width)
                     _wf.setframerate(buf.sample_rate)
                     _wf.writeframes((audio_array * 32768).astype(_np.int16).tobytes())
                 logger.info(
-                    "Diagnostic WAV saved: %s (sr=%d ch=%d)",
+                    "Diagnostic WAV saved: %s (sr=%d ch=1)",
                     _diag_path,
                     buf.sample_rate,
-                    buf.channels,
                 )
             except Exception:
                 pass  # diagnostic only — never block transcription
             text = await self._transcriber.transcribe(audio_array)
         except TranscriptionError as exc:
             logger.error("Transcription failed: %s", exc)
-            self._state = SessionState.IDLE
-            self._current_question = None
-            self._task_start = None
-            await self.send_frame(
-                {
-                    "type": "error",
-                    "detail": "Transcription failed",
-                    "code": ErrorCode.TRANSCRIPTION_FAILED,
-                }
-            )
-            await self.send_frame({"type": "status", "status": "idle"})
+            await self._send_error_and_idle("Transcription failed", ErrorCode.TRANSCRIPTION_FAILED)
             return
         except TimeoutError:
             logger.error("Transcription timed out")
-            self._state = SessionState.IDLE
-            self._current_question = None
-            self._task_start = None
-            await self.send_frame(
-                {
-                    "type": "error",
-                    "detail": "Transcription timed out",
-                    "code": ErrorCode.TIMEOUT,
-                }
-            )
-            await self.send_frame({"type": "status", "status": "idle"})
+            await self._send_error_and_idle("Transcription timed out", ErrorCode.TIMEOUT)
             return
         except Exception:
             logger.exception("Unexpected transcription error")
-            self._state = SessionState.IDLE
-            self._current_question = None
-            self._task_start = None
-            await self.send_frame(
-                {
-                    "type": "error",
-                    "detail": "Internal transcription error",
-                    "code": ErrorCode.INTERNAL_ERROR,
-                }
+            await self._send_error_and_idle(
+                "Internal transcription error", ErrorCode.INTERNAL_ERROR
             )
-            await self.send_frame({"type": "status", "status": "idle"})
             return
 
         # Skip OpenClaw when transcription is empty (silence / no speech)
         if not text.strip():
             logger.debug("Empty transcription — no speech detected")
-            self._state = SessionState.IDLE
-            self._current_question = None
-            self._task_start = None
-            await self.send_frame({"type": "transcription", "text": ""})
-            await self.send_frame(
-                {
-                    "type": "error",
-                    "detail": "No speech detected — try again",
-                    "code": ErrorCode.TRANSCRIPTION_FAILED,
-                }
+            await self.send_trusted({"type": "transcription", "text": ""})
+            await self._send_error_and_idle(
+                "No speech detected — try again", ErrorCode.TRANSCRIPTION_FAILED
             )
-            await self.send_frame({"type": "status", "status": "idle"})
             return
 
         # Send transcription to client and return to idle for user confirmation
-        await self.send_frame({"type": "transcription", "text": text})
+        await self.send_trusted({"type": "transcription", "text": text})
         self._state = SessionState.IDLE
-        await self.send_frame({"type": "status", "status": "idle"})
+        await self.send_raw(_STATUS_FRAMES["idle"])
 
     async def _handle_text(self, frame: dict[str, Any]) -> None:
         self._current_question = frame["message"]
@@ -703,25 +861,20 @@ class GatewaySession:
             await self._server._discard_inflight()
 
         self._state = SessionState.THINKING
-        await self.send_frame({"type": "status", "status": "thinking"})
+        await self.send_raw(_STATUS_FRAMES["thinking"])
 
         # If handler supports start_stream, use the buffered background path
         if self._server is not None and hasattr(self._handler, "start_stream"):
             try:
-                stream = await asyncio.wait_for(
-                    self._handler.start_stream(frame["message"]),
-                    timeout=self._timeout,
-                )
+                # Deadline on the current task itself — no wait_for wrapper
+                async with asyncio.timeout(self._timeout):
+                    stream = await self._handler.start_stream(frame["message"])
             except TimeoutError:
                 logger.error("OpenClaw request timed out")
                 await self._handler.close()
                 try:
-                    await self.send_frame(
-                        {
-                            "type": "error",
-                            "detail": f"Agent cycle exceeded {self._timeout}s timeout",
-                            "code": ErrorCode.TIMEOUT,
-                        }
+                    await self.send_error(
+                        f"Agent cycle exceeded {self._timeout}s timeout", ErrorCode.TIMEOUT
                     )
                 except Exception:
                     logger.debug("Failed to send timeout error frame", exc_info=True)
@@ -729,7 +882,7 @@ class GatewaySession:
                 self._current_question = None
                 self._task_start = None
                 try:
-                    await self.send_frame({"type": "status", "status": "idle"})
+                    await self.send_raw(_STATUS_FRAMES["idle"])
                 except Exception:
                     logger.debug("Failed to send idle status on cleanup", exc_info=True)
                 return
@@ -737,20 +890,14 @@ class GatewaySession:
                 logger.error("OpenClaw error: %s", exc)
                 await self._handler.close()
                 try:
-                    await self.send_frame(
-                        {
-                            "type": "error",
-                            "detail": "Agent communication error",
-                            "code": ErrorCode.OPENCLAW_ERROR,
-                        }
-                    )
+                    await self.send_error("Agent communication error", ErrorCode.OPENCLAW_ERROR)
                 except Exception:
                     logger.debug("Failed to send OpenClaw error frame", exc_info=True)
                 self._state = SessionState.IDLE
                 self._current_question = None
                 self._task_start = None
                 try:
-                    await self.send_frame({"type": "status", "status": "idle"})
+                    await self.send_raw(_STATUS_FRAMES["idle"])
                 except Exception:
                     logger.debug("Failed to send idle status on cleanup", exc_info=True)
                 return
@@ -758,27 +905,21 @@ class GatewaySession:
                 logger.exception("Response handler error")
                 await self._handler.close()
                 try:
-                    await self.send_frame(
-                        {
-                            "type": "error",
-                            "detail": "Response processing failed",
-                            "code": ErrorCode.OPENCLAW_ERROR,
-                        }
-                    )
+                    await self.send_error("Response processing failed", ErrorCode.OPENCLAW_ERROR)
                 except Exception:
                     logger.debug("Failed to send handler error frame", exc_info=True)
                 self._state = SessionState.IDLE
                 self._current_question = None
                 self._task_start = None
                 try:
-                    await self.send_frame({"type": "status", "status": "idle"})
+                    await self.send_raw(_STATUS_FRAMES["idle"])
                 except Exception:
                     logger.debug("Failed to send idle status on cleanup", exc_info=True)
                 return
 
             # Stream obtained — transition to streaming and start background task
             self._state = SessionState.STREAMING
-            await self.send_frame({"type": "status", "status": "streaming"})
+            await self.send_raw(_STATUS_FRAMES["streaming"])
 
             buffer = InflightBuffer(user_question=frame["message"])
             self._server._inflight_buffer = buffer
@@ -792,20 +933,14 @@ class GatewaySession:
 
         # Fallback: original synchronous path for mock/other handlers
         try:
-            await asyncio.wait_for(
-                self._handler.handle(frame["message"], self.send_frame),
-                timeout=self._timeout,
-            )
+            async with asyncio.timeout(self._timeout):
+                await self._handler.handle(frame["message"], self.send_frame)
         except TimeoutError:
             logger.error("Agent cycle timed out after %ss", self._timeout)
             await self._handler.close()
             try:
-                await self.send_frame(
-                    {
-                        "type": "error",
-                        "detail": f"Agent cycle exceeded {self._timeout}s timeout",
-                        "code": ErrorCode.TIMEOUT,
-                    }
+                await self.send_error(
+                    f"Agent cycle exceeded {self._timeout}s timeout", ErrorCode.TIMEOUT
                 )
             except Exception:
                 logger.debug("Failed to send timeout error frame", exc_info=True)
@@ -813,26 +948,14 @@ class GatewaySession:
             logger.error("OpenClaw error: %s", exc)
             await self._handler.close()
             try:
-                await self.send_frame(
-                    {
-                        "type": "error",
-                        "detail": "Agent communication error",
-                        "code": ErrorCode.OPENCLAW_ERROR,
-                    }
-                )
+                await self.send_error("Agent communication error", ErrorCode.OPENCLAW_ERROR)
             except Exception:
                 logger.debug("Failed to send OpenClaw error frame", exc_info=True)
         except Exception:
             logger.exception("Response handler error")
             await self._handler.close()
             try:
-                await self.send_frame(
-                    {
-                        "type": "error",
-                        "detail": "Response processing failed",
-                        "code": ErrorCode.OPENCLAW_ERROR,
-                    }
-                )
+                await self.send_error("Response processing failed", ErrorCode.OPENCLAW_ERROR)
             except Exception:
                 logger.debug("Failed to send handler error frame", exc_info=True)
         finally:
@@ -840,7 +963,7 @@ class GatewaySession:
             self._current_question = None
             self._task_start = None
             try:
-                await self.send_frame({"type": "status", "status": "idle"})
+                await self.send_raw(_STATUS_FRAMES["idle"])
             except Exception:
                 logger.debug("Failed to send idle status on cleanup", exc_info=True)
 
@@ -855,6 +978,7 @@ class GatewayServer:
         transcriber: Transcriber | None = None,
     ) -> None:
         self.config = config
+        self._token_bytes = config.gateway_token.encode() if config.gateway_token else b""
         self._transcriber = transcriber
         self._current_session: GatewaySession | None = None
         self._inflight_buffer: InflightBuffer | None = None
@@ -877,33 +1001,46 @@ class GatewayServer:
         else:
             self._handler = MockResponseHandler()
 
+    def _check_auth_frame(self, raw: str | bytes) -> bool:
+        """Validate the first-message auth frame in constant time.
+
+        Accepts either a binary frame (``_AUTH_MAGIC`` + token bytes), which
+        skips JSON parsing, or the ``{"type":"auth","token":...}`` text frame.
+
+        Raises:
+            JSONDecodeError: If a text frame is not valid JSON.
+        """
+        if isinstance(raw, bytes):
+            if raw[:1] != _AUTH_MAGIC:
+                return False
+            return hmac.compare_digest(raw[1:], self._token_bytes)
+        auth_frame = json_codec.loads(raw)
+        return (
+            isinstance(auth_frame, dict)
+            and auth_frame.get("type") == "auth"
+            and isinstance(auth_frame.get("token"), str)
+            and hmac.compare_digest(auth_frame["token"].encode(), self._token_bytes)
+        )
+
     async def handler(self, ws: ServerConnection) -> None:
         """Handle a new WebSocket connection."""
+        _set_tcp_nodelay(ws)
+
         # --- token auth ---
         if self.config.gateway_token:
             # Deprecation warning for query-string token
-            if ws.request is not None:
-                query = parse_qs(urlparse(ws.request.path).query)
-                if query.get("token"):
-                    logger.warning(
-                        "Client attempted query-string token auth (deprecated and disabled). "
-                        "Use the first-message auth handshake instead."
-                    )
+            if ws.request is not None and _has_query_token(ws.request.path):
+                logger.warning(
+                    "Client attempted query-string token auth (deprecated and disabled). "
+                    "Use the first-message auth handshake instead."
+                )
 
             # First-message auth handshake (only supported method)
             authenticated = False
             try:
                 raw = await asyncio.wait_for(ws.recv(), timeout=self.config.auth_timeout)
-                if isinstance(raw, str):
-                    auth_frame = json.loads(raw)
-                    if (
-                        isinstance(auth_frame, dict)
-                        and auth_frame.get("type") == "auth"
-                        and isinstance(auth_frame.get("token"), str)
-                        and hmac.compare_digest(auth_frame["token"], self.config.gateway_token)
-                    ):
-                        authenticated = True
-            except (TimeoutError, json.JSONDecodeError, websockets.ConnectionClosed):
+                authenticated = self._check_auth_frame(raw)
+            except (TimeoutError, json_codec.JSONDecodeError, websockets.ConnectionClosed):
                 pass
 
             if not authenticated:
@@ -941,8 +1078,10 @@ class GatewayServer:
         except websockets.ConnectionClosed:
             logger.info("Connection closed")
         finally:
-            # Clean up local audio stream on disconnect
+            # Clean up local audio stream and recording timer on disconnect
             session._stop_local_stream()
+            session._cancel_recording_timeout()
+            session._cancel_recording_timeout_task()
             if self._current_session is session:
                 self._current_session = None
             # NOTE: Do NOT cancel _inflight_task — it must finish draining
@@ -959,7 +1098,7 @@ class GatewayServer:
 
         if self._current_session is not None:
             try:
-                await self._current_session.send_frame(
+                await self._current_session.send_trusted(
                     {
                         "type": "session_reset",
                         "reason": reason,
@@ -992,7 +1131,7 @@ class GatewayServer:
         # Send pending reset notification
         if self._pending_reset_reason is not None:
             try:
-                await session.send_frame(
+                await session.send_trusted(
                     {
                         "type": "session_reset",
                         "reason": self._pending_reset_reason,
@@ -1020,6 +1159,8 @@ class GatewayServer:
         runs on the same event loop — there are no true concurrent accesses,
         only interleaved execution at await points.
         """
+        batcher: _DeltaBatcher | None = None
+        batched_for: GatewaySession | None = None
         try:
             async for delta in stream:
                 if not buffer.append_delta(delta):
@@ -1028,44 +1169,57 @@ class GatewayServer:
                     )
 
                 session = self._current_session
-                if session is not None:
-                    try:
-                        await session.send_frame({"type": "assistant", "delta": delta})
-                    except Exception:
-                        logger.info("Phone disconnected mid-stream — continuing to buffer")
+                if session is not batched_for:
+                    # A reconnecting phone is caught up from buffer.full_text,
+                    # so deltas still pending for the old session are dropped.
+                    if batcher is not None:
+                        batcher.discard()
+                    batcher = (
+                        _DeltaBatcher(session.send_frame, send_raw=session.send_raw)
+                        if session is not None
+                        else None
+                    )
+                    batched_for = session
+                if batcher is not None:
+                    batcher.add(delta)
             buffer.complete = True
         except OpenClawError as exc:
             buffer.error = str(exc)
             logger.error("OpenClaw error during inflight stream: %s", exc)
         except asyncio.CancelledError:
+            if batcher is not None:
+                batcher.discard()
             raise  # let cancellation propagate
         except Exception:
             buffer.error = "internal error"
             logger.exception("Unexpected error during inflight stream")
         finally:
             session = self._current_session
+            if batcher is not None:
+                if batched_for is session and (buffer.complete or buffer.error):
+                    try:
+                        await batcher.flush()
+                    except Exception:
+                        logger.info("Phone disconnected mid-stream — continuing to buffer")
+                batcher.discard()
             if session is not None and buffer.complete and self._inflight_buffer is buffer:
                 try:
-                    await session.send_frame({"type": "end"})
+                    await session.send_raw(_END_FRAME)
                     session._state = SessionState.IDLE
                     session._current_question = None
                     session._task_start = None
-                    await session.send_frame({"type": "status", "status": "idle"})
+                    await session.send_raw(_STATUS_FRAMES["idle"])
                 except Exception:
                     pass
             elif session is not None and buffer.error and self._inflight_buffer is buffer:
                 try:
-                    await session.send_frame(
-                        {
-                            "type": "error",
-                            "detail": f"Agent error: {buffer.error}",
-                            "code": ErrorCode.OPENCLAW_ERROR,
-                        }
+                    await session.send_error(
+                        f"Agent error: {buffer.error}", ErrorCode.OPENCLAW_ERROR
                     )
                     session._state = SessionState.IDLE
                     session._current_question = None
                     session._task_start = None
-                    await session.send_frame({"type": "status", "status": "idle"})
+                    await session.send_raw(_STATUS_FRAMES["idle"])
                 except Exception:
                     pass
 
@@ -1085,12 +1239,8 @@ class GatewayServer:
             return
 
         if buf.error:
-            await session.send_frame(
-                {
-                    "type": "error",
-                    "detail": f"Previous response failed: {buf.error}",
-                    "code": ErrorCode.OPENCLAW_ERROR,
-                }
+            await session.send_error(
+                f"Previous response failed: {buf.error}", ErrorCode.OPENCLAW_ERROR
             )
             session._state = SessionState.IDLE
             session._current_question = None
@@ -1099,14 +1249,14 @@ class GatewayServer:
             return
 
         if buf.complete:
-            await session.send_frame({"type": "status", "status": "streaming"})
+            await session.send_raw(_STATUS_FRAMES["streaming"])
             session._state = SessionState.STREAMING
-            await session.send_frame({"type": "assistant", "delta": buf.full_text})
-            await session.send_frame({"type": "end"})
+            await session.send_raw(_encode_assistant_delta(buf.full_text))
+            await session.send_raw(_END_FRAME)
             session._state = SessionState.IDLE
             session._current_question = None
             session._task_start = None
-            await session.send_frame({"type": "status", "status": "idle"})
+            await session.send_raw(_STATUS_FRAMES["idle"])
             self._inflight_buffer = None
             return
 
@@ -1115,12 +1265,12 @@ class GatewayServer:
 
     async def _splice_inflight(self, session: GatewaySession, buf: InflightBuffer) -> None:
         """Splice buffered deltas with the live stream for a reconnecting phone."""
-        await session.send_frame({"type": "status", "status": "streaming"})
+        await session.send_raw(_STATUS_FRAMES["streaming"])
         session._state = SessionState.STREAMING
         session._current_question = buf.user_question
         session._task_start = asyncio.get_running_loop().time()
         if buf.full_text:
-            await session.send_frame({"type": "assistant", "delta": buf.full_text})
+            await session.send_raw(_encode_assistant_delta(buf.full_text))
         # The background task will forward new deltas to the new _current_session
 
     async def _discard_inflight(self) -> None:
@@ -1159,7 +1309,12 @@ class GatewayServer:
             self.config.gateway_port,
         )
         serve_kwargs: dict[str, object] = {
-            "max_size": 2**16,  # 64 KiB max frame size
+            "max_size": 2**16,  # 64 KiB max frame size (PCM arrives in ~3 KiB chunks)
+            # Small JSON frames and int16 PCM barely compress; skip per-frame deflate
+            "compression": None,
+            "max_queue": 16,  # bounded inbound queue so a fast sender sees backpressure
+            "ping_interval": 20,
+            "ping_timeout": 20,
             "process_request": self._process_request,
         }
         if self.config.allowed_origins is not None:
@@ -1227,6 +1382,20 @@ def _setup_cuda_library_paths() -> None:
             logger.warning("CUDA lib %s not found — GPU transcription may fail", lib_name)
 
 
+def event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return ``uvloop``'s loop factory when installed, else ``None`` (stdlib loop).
+
+    Pass the result as ``asyncio.run(..., loop_factory=...)``.  uvloop ships in
+    the ``fast`` extra: ``uv sync --extra fast``.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    factory: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+    return factory
+
+
 async def main() -> None:
     """Entry point: load config, initialise transcriber, and start serving."""
     logging.basicConfig(
@@ -1269,5 +1438,16 @@ async def main() -> None:
     except Exception:
         logger.warning("Failed to load transcriber — audio transcription disabled", exc_info=True)
 
+    if transcriber is not None:
+        try:
+            await transcriber.warmup()
+            logger.info("Transcriber warmed up")
+        except Exception:
+            logger.warning("Transcriber warm-up failed — continuing", exc_info=True)
+
     server = GatewayServer(config, transcriber=transcriber)
-    await server.serve()
+    try:
+        await server.serve()
+    finally:
+        if transcriber is not None:
+            transcriber.close()
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     import numpy as np
 
 
+# 0.1 s of 16 kHz silence for the startup warm-up pass
+_WARMUP_SAMPLES = 1_600
+
+
 class TranscriptionError(Exception):
     """Raised when transcription fails or produces empty result."""
 
@@ -26,6 +31,34 @@ class Transcriber:
         from faster_whisper import WhisperModel
 
         self._model = WhisperModel(model_name, device=device, compute_type=compute_type)
+        # Dedicated worker so inference never queues behind (or starves) other
+        # blocking work on the loop's default executor; requests run one at a time.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+
+    async def warmup(self) -> None:
+        """Run one throwaway inference so the first real request skips model/kernel init.
+
+        Runs on the inference worker thread (device contexts are per-thread).
+        VAD is off so the silent input still reaches the encoder and decoder.
+        """
+        import numpy as np
+
+        def _run_warmup() -> None:
+            segments, _info = self._model.transcribe(
+                np.zeros(_WARMUP_SAMPLES, dtype=np.float32),
+                language="en",
+                beam_size=1,
+                best_of=1,
+                temperature=0.0,
+                condition_on_previous_text=False,
+                vad_filter=False,
+            )
+            # Segments are generated lazily — consume them to actually decode
+            for _ in segments:
+                pass
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, _run_warmup)
 
     async def transcribe(
         self,
@@ -35,7 +68,7 @@ class Transcriber:
     ) -> str:
         """Transcribe audio array to text.
 
-        Runs inference in a thread pool executor to avoid blocking the event loop.
+        Runs inference on the transcriber's worker thread to avoid blocking the event loop.
         Uses greedy decoding with VAD filter per doc 02 §4.6.
 
         Raises:
@@ -58,7 +91,7 @@ class Transcriber:
             return " ".join(seg.text.strip() for seg in segments).strip()
 
         result = await asyncio.wait_for(
-            loop.run_in_executor(None, _run_inference),
+            loop.run_in_executor(self._executor, _run_inference),
             timeout=timeout,
         )
 
@@ -66,3 +99,7 @@ class Transcriber:
             raise TranscriptionError("Transcription produced empty result")
 
         return result
+
+    def close(self) -> None:
+        """Shut down the inference worker without waiting for a running job."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,9 +1,18 @@
-"""Azure operations module — wraps az cli commands via subprocess."""
+"""Azure operations module — wraps az and bicep cli commands via subprocess."""
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
+import os
+import re
 import shutil
 import subprocess
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -22,28 +31,75 @@ class CommandResult:
     return_code: int
 
 
+@dataclass(frozen=True, slots=True)
+class CompiledTemplate:
+    """ARM JSON produced by :func:`compile_bicep`, ready to hand to ``az deployment``."""
+
+    template_file: Path
+    parameters_file: Path
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 _DEFAULT_TEMPLATE: Path = Path("infra/main.bicep")
 
+_PREREQ_CACHE_TTL: float = 3600.0
 
-def _run_az(args: list[str], *, timeout: int = 600) -> CommandResult:
-    """Execute an ``az`` CLI command and return a :class:`CommandResult`.
+_DEPLOYMENT_SUMMARY_QUERY: str = (
+    "properties.{provisioningState: provisioningState, outputs: outputs}"
+)
 
-    Parameters
-    ----------
-    args:
-        Arguments to pass **after** ``az`` (e.g. ``["deployment", "sub", "create", ...]``).
-    timeout:
-        Maximum seconds to wait before killing the process.
+# Applied unless the user's environment sets them: with telemetry on, every
+# ``az`` invocation forks a background uploader on exit.
+_AZ_ENV_DEFAULTS: dict[str, str] = {"AZURE_CORE_COLLECT_TELEMETRY": "0"}
+
+# Where ``az bicep install`` drops the standalone binary.
+_AZ_MANAGED_BICEP: Path = Path.home() / ".azure" / "bin" / "bicep"
+
+_BICEP_CONFIG: str = "bicepconfig.json"
+
+# Bicep functions that read arbitrary files at compile time.  The compile
+# cache cannot see those files, so sources that call them are never cached.
+_BICEP_LOAD_CALL: re.Pattern[bytes] = re.compile(
+    rb"\bload(?:TextContent|JsonContent|YamlContent|FileAsBase64|DirectoryFileInfo)\s*\("
+)
+
+
+@functools.cache
+def _az_executable() -> str | None:
+    """Resolve ``az`` to an absolute path once, or ``None`` if it is not installed.
+
+    :mod:`subprocess` only takes its ``posix_spawn`` fast path when the
+    executable has a directory component; a bare ``"az"`` forces fork+exec.
+    """
+    return shutil.which("az")
+
+
+@functools.cache
+def _bicep_executable() -> str | None:
+    """Locate a standalone Bicep binary, or ``None`` to go through ``az bicep``.
+
+    Invoking Bicep directly skips the Python interpreter start-up and module
+    loading that every ``az`` invocation pays before doing any work.
     """
+    found = shutil.which("bicep")
+    if found is not None:
+        return found
+    if _AZ_MANAGED_BICEP.is_file():
+        return str(_AZ_MANAGED_BICEP)
+    return None
+
+
+def _run(argv: list[str], *, timeout: int, env: dict[str, str] | None = None) -> CommandResult:
+    """Execute *argv* and wrap the outcome in a :class:`CommandResult`."""
     completed = subprocess.run(
-        ["az", *args],
+        argv,
         capture_output=True,
         text=True,
         timeout=timeout,
+        env=env,
     )
     return CommandResult(
         success=completed.returncode == 0,
@@ -53,18 +109,172 @@ def _run_az(args: list[str], *, timeout: int = 600) -> CommandResult:
     )
 
 
+def _run_az(args: list[str], *, timeout: int = 600) -> CommandResult:
+    """Execute an ``az`` CLI command and return a :class:`CommandResult`.
+
+    Parameters
+    ----------
+    args:
+        Arguments to pass **after** ``az`` (e.g. ``["deployment", "sub", "create", ...]``).
+    timeout:
+        Maximum seconds to wait before killing the process.
+    """
+    env = {**_AZ_ENV_DEFAULTS, **os.environ}
+    return _run([_az_executable() or "az", *args], timeout=timeout, env=env)
+
+
+def _run_bicep(args: list[str], *, timeout: int = 600) -> CommandResult:
+    """Execute a Bicep CLI command, bypassing ``az`` when the binary is available.
+
+    Parameters
+    ----------
+    args:
+        Arguments to pass **after** ``bicep`` (e.g. ``["build", "main.bicep"]``).
+        The ``az bicep`` fallback accepts the same subcommands but spells the
+        input as ``--file``, so callers pass it as the first positional argument.
+    timeout:
+        Maximum seconds to wait before killing the process.
+    """
+    bicep = _bicep_executable()
+    if bicep is not None:
+        return _run([bicep, *args], timeout=timeout)
+    command, *rest = args
+    if command == "--version":
+        return _run_az(["bicep", "version"], timeout=timeout)
+    if rest:
+        rest = ["--file", *rest]
+    return _run_az(["bicep", command, *rest], timeout=timeout)
+
+
+def _cache_dir() -> Path:
+    """Return the per-user cache directory for this CLI."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "azure-infra-cli"
+
+
+def _prereq_cache_path() -> Path:
+    """Return the on-disk location of the cached prerequisite check."""
+    return _cache_dir() / "prereq.json"
+
+
+def _prereq_fingerprint(az_path: str) -> dict[str, object]:
+    """Identify the installed toolchain so an upgrade or removal invalidates the cache."""
+    fingerprint: dict[str, object] = {"az": az_path, "az_mtime": os.stat(az_path).st_mtime_ns}
+    bicep = _bicep_executable()
+    if bicep is not None:
+        fingerprint["bicep"] = bicep
+        fingerprint["bicep_mtime"] = os.stat(bicep).st_mtime_ns
+    return fingerprint
+
+
+def _load_prereq_cache(fingerprint: dict[str, object]) -> CommandResult | None:
+    """Return the cached successful check if it is fresh and matches *fingerprint*."""
+    path = _prereq_cache_path()
+    try:
+        if time.time() - path.stat().st_mtime >= _PREREQ_CACHE_TTL:
+            return None
+        cached = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("fingerprint") != fingerprint:
+        return None
+    return CommandResult(
+        success=True, stdout=str(cached.get("stdout", "")), stderr="", return_code=0
+    )
+
+
+def _store_prereq_cache(fingerprint: dict[str, object], result: CommandResult) -> None:
+    """Atomically persist a successful check; failures to write are ignored."""
+    path = _prereq_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as fh:
+            json.dump({"fingerprint": fingerprint, "stdout": result.stdout}, fh)
+        os.replace(tmp, path)
+    except OSError:
+        return
+
+
+def _source_digest(template: Path, param_file: Path) -> str | None:
+    """Hash every input that affects the compiled output of *template* and *param_file*.
+
+    Covers the ``.bicep`` files under the template directory, the parameter
+    file, and every ``bicepconfig.json`` under that directory or above the
+    template and parameter file.  Returns ``None`` when a source calls one of
+    Bicep's ``load*`` functions, whose inputs are not tracked.
+    """
+    sources = {*template.parent.rglob("*.bicep"), template, param_file}
+    configs = set(template.parent.rglob(_BICEP_CONFIG))
+    for directory in (template.parent.resolve(), param_file.parent.resolve()):
+        configs.update(
+            d / _BICEP_CONFIG
+            for d in (directory, *directory.parents)
+            if (d / _BICEP_CONFIG).is_file()
+        )
+
+    digest = hashlib.blake2b(digest_size=8)
+    for source in sorted({p.resolve() for p in sources | configs}):
+        data = source.read_bytes()
+        if source.name != _BICEP_CONFIG and _BICEP_LOAD_CALL.search(data):
+            return None
+        digest.update(str(source).encode())
+        digest.update(b"\0")
+        digest.update(data)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _template_args(param_file: str, compiled: CompiledTemplate | None) -> list[str]:
+    """Build the ``--template-file``/``--parameters`` pair for ``az deployment``."""
+    if compiled is None:
+        return ["--template-file", str(_DEFAULT_TEMPLATE), "--parameters", param_file]
+    return [
+        "--template-file",
+        str(compiled.template_file),
+        "--parameters",
+        f"@{compiled.parameters_file}",
+    ]
+
+
+def run_many(calls: Sequence[Callable[[], CommandResult]]) -> list[CommandResult]:
+    """Run independent operations concurrently and return their results in order.
+
+    Each call spends its time blocked on an ``az`` subprocess, so threads
+    overlap the ARM round-trips without contending for the GIL.
+
+    Parameters
+    ----------
+    calls:
+        Zero-argument callables, typically lambdas wrapping the operations below.
+    """
+    if len(calls) <= 1:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        futures = [pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+
 # ---------------------------------------------------------------------------
 # Public operations
 # ---------------------------------------------------------------------------
 
 
-def check_prerequisites() -> CommandResult:
+def check_prerequisites(*, use_cache: bool = True) -> CommandResult:
     """Verify that the ``az`` CLI and Bicep extension are installed.
 
     Returns a successful :class:`CommandResult` when both are available, or a
-    failure result describing what is missing.
+    failure result describing what is missing.  A successful check is cached
+    on disk for an hour and reused while the ``az`` and ``bicep`` binaries are
+    unchanged; failures are always re-checked.
+
+    Parameters
+    ----------
+    use_cache:
+        If ``False`` skip the on-disk cache and always run the Bicep check.
     """
-    if shutil.which("az") is None:
+    az_path = _az_executable()
+    if az_path is None:
         return CommandResult(
             success=False,
             stdout="",
@@ -72,7 +282,13 @@ def check_prerequisites() -> CommandResult:
             return_code=1,
         )
 
-    bicep_check = _run_az(["bicep", "version"])
+    fingerprint = _prereq_fingerprint(az_path)
+    if use_cache:
+        cached = _load_prereq_cache(fingerprint)
+        if cached is not None:
+            return cached
+
+    bicep_check = _run_bicep(["--version"])
     if not bicep_check.success:
         return CommandResult(
             success=False,
@@ -81,12 +297,72 @@ def check_prerequisites() -> CommandResult:
             return_code=1,
         )
 
-    return CommandResult(
+    result = CommandResult(
         success=True,
         stdout=f"az CLI found. {bicep_check.stdout}",
         stderr="",
         return_code=0,
     )
+    _store_prereq_cache(fingerprint, result)
+    return result
+
+
+def compile_bicep(
+    param_file: str,
+    template: Path = _DEFAULT_TEMPLATE,
+) -> CompiledTemplate | None:
+    """Compile *template* and *param_file* to ARM JSON once, reusing earlier builds.
+
+    ``az deployment`` otherwise recompiles the Bicep sources on every call.
+    Output is cached under the user cache directory, keyed by a hash of the
+    template, its sibling modules, the parameter file and any applicable
+    ``bicepconfig.json`` (see :func:`_source_digest`), so unchanged sources
+    are never rebuilt.  Returns ``None`` when compilation fails or the sources
+    use ``load*`` functions, which the cache key cannot cover; callers then
+    fall back to passing the Bicep sources to ``az`` directly, which reports
+    any compiler error itself.
+
+    Parameters
+    ----------
+    param_file:
+        Path to the ``.bicepparam`` file.
+    template:
+        Path to the root ``.bicep`` template.  Defaults to ``infra/main.bicep``.
+    """
+    try:
+        digest = _source_digest(template, Path(param_file))
+    except OSError:
+        return None
+    if digest is None:
+        return None
+
+    out_dir = _cache_dir() / "compiled" / digest
+    compiled = CompiledTemplate(
+        template_file=out_dir / "main.json",
+        parameters_file=out_dir / "parameters.json",
+    )
+    if compiled.template_file.is_file() and compiled.parameters_file.is_file():
+        return compiled
+
+    try:
+        out_dir.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=out_dir.parent))
+    except OSError:
+        return None
+    build = _run_bicep(["build", str(template), "--outfile", str(staging / "main.json")])
+    if build.success:
+        build = _run_bicep(
+            ["build-params", param_file, "--outfile", str(staging / "parameters.json")]
+        )
+    if not build.success:
+        shutil.rmtree(staging, ignore_errors=True)
+        return None
+    try:
+        staging.replace(out_dir)
+    except OSError:
+        # Another run published the same digest first; its output is identical.
+        shutil.rmtree(staging, ignore_errors=True)
+    return compiled
 
 
 def run_deployment(
@@ -95,6 +371,7 @@ def run_deployment(
     param_file: str,
     *,
     what_if: bool = False,
+    compiled: CompiledTemplate | None = None,
 ) -> CommandResult:
     """Create (or what-if) a subscription-scoped deployment.
 
@@ -108,6 +385,9 @@ def run_deployment(
         Path to the ``.bicepparam`` file.
     what_if:
         If ``True`` run a what-if analysis instead of a real deployment.
+    compiled:
+        Pre-compiled ARM JSON from :func:`compile_bicep`; used in place of
+        the Bicep sources when given.
     """
     args = [
         "deployment",
@@ -117,14 +397,15 @@ def run_deployment(
         subscription_id,
         "--location",
         location,
-        "--template-file",
-        str(_DEFAULT_TEMPLATE),
-        "--parameters",
-        param_file,
+        *_template_args(param_file, compiled),
     ]
 
     if what_if:
         args.append("--what-if")
+    else:
+        # The full deployment object echoes the template and every output
+        # resource; only the outcome and outputs are worth printing.
+        args += ["--query", _DEPLOYMENT_SUMMARY_QUERY]
 
     return _run_az(args)
 
@@ -133,6 +414,8 @@ def validate_template(
     subscription_id: str,
     location: str,
     param_file: str,
+    *,
+    compiled: CompiledTemplate | None = None,
 ) -> CommandResult:
     """Validate Bicep templates without deploying.
 
@@ -144,6 +427,9 @@ def validate_template(
         Azure region.
     param_file:
         Path to the ``.bicepparam`` file.
+    compiled:
+        Pre-compiled ARM JSON from :func:`compile_bicep`; used in place of
+        the Bicep sources when given.
     """
     return _run_az(
         [
@@ -154,10 +440,7 @@ def validate_template(
             subscription_id,
             "--location",
             location,
-            "--template-file",
-            str(_DEFAULT_TEMPLATE),
-            "--parameters",
-            param_file,
+            *_template_args(param_file, compiled),
         ]
     )
 
@@ -175,22 +458,44 @@ def delete_resource_group(
     resource_group_name:
         Name of the resource group to delete.
     """
+    return delete_resource_groups(subscription_id, [resource_group_name])
+
+
+def delete_resource_groups(
+    subscription_id: str,
+    resource_group_names: Sequence[str],
+) -> CommandResult:
+    """Delete several Azure resource groups with a single ``az`` invocation.
+
+    ``az`` fans ``--ids`` out in-process, so N groups cost one process start
+    rather than N.
+
+    Parameters
+    ----------
+    subscription_id:
+        Azure subscription ID.
+    resource_group_names:
+        Names of the resource groups to delete.
+    """
+    ids = [
+        f"/subscriptions/{subscription_id}/resourceGroups/{name}" for name in resource_group_names
+    ]
     return _run_az(
         [
             "group",
             "delete",
-            "--subscription",
-            subscription_id,
-            "--name",
-            resource_group_name,
+            "--ids",
+            *ids,
             "--yes",
             "--no-wait",
+            "--output",
+            "none",
         ]
     )
 
 
 def lint_bicep(template_path: str | None = None) -> CommandResult:
-    """Run the Bicep linter (``az bicep build``) on a template.
+    """Run the Bicep linter (``bicep build``) on a template.
 
     Parameters
     ----------
@@ -198,4 +503,4 @@ def lint_bicep(template_path: str | None = None) -> CommandResult:
         Path to the ``.bicep`` file to lint.  Defaults to ``infra/main.bicep``.
     """
     path = template_path or str(_DEFAULT_TEMPLATE)
-    return _run_az(["bicep", "build", "--file", path])
+    return _run_bicep(["build", path])
@@ -47,6 +47,10 @@ ConfirmOpt = Annotated[
     bool,
     typer.Option("--confirm/--no-confirm", help="Prompt for confirmation before executing."),
 ]
+NoCachePrereqOpt = Annotated[
+    bool,
+    typer.Option("--no-cache-prereq", help="Always re-run the prerequisite check."),
+]
 
 # ---------------------------------------------------------------------------
 # Commands
@@ -61,34 +65,56 @@ def deploy(
     confirm: ConfirmOpt = True,
     dry_run: Annotated[
         bool,
-        typer.Option("--dry-run", help="Run validate + what-if only, skip actual deployment."),
+        typer.Option("--dry-run", help="Run what-if only, skip actual deployment."),
+    ] = False,
+    strict_validate: Annotated[
+        bool,
+        typer.Option(
+            "--strict-validate", help="Also run a separate template validation alongside what-if."
+        ),
     ] = False,
+    no_cache_prereq: NoCachePrereqOpt = False,
 ) -> None:
     """Deploy the Azure infrastructure (subscription-scoped)."""
     # 1. Prerequisites
     print_step("Checking prerequisites…")
-    prereq = azure_ops.check_prerequisites()
+    prereq = azure_ops.check_prerequisites(use_cache=not no_cache_prereq)
     if not prereq.success:
         print_error(prereq.stderr)
         raise typer.Exit(code=1)
     print_success("Prerequisites satisfied")
 
-    # 2. Validate
-    print_step("Validating Bicep templates…")
-    with create_status("Validating…"):
-        validation = azure_ops.validate_template(subscription_id, location, param_file)
-    if not validation.success:
-        print_error("Template validation failed")
-        print_deployment_result(validation)
-        raise typer.Exit(code=1)
-    print_success("Template validation passed")
-
-    # 3. What-if
-    print_step("Running what-if analysis…")
-    with create_status("Analysing changes…"):
-        whatif_result = azure_ops.run_deployment(
-            subscription_id, location, param_file, what_if=True
+    # 2. Compile once so what-if and deploy don't each rebuild the Bicep
+    with create_status("Compiling Bicep templates…"):
+        compiled = azure_ops.compile_bicep(param_file)
+    if compiled is None:
+        print_warning("Could not pre-compile templates; az will compile them on each call")
+
+    # 3. What-if — ARM runs the same preflight validation server-side, so a
+    # separate validate call is only made (concurrently) with --strict-validate
+    calls = [
+        lambda: azure_ops.run_deployment(
+            subscription_id, location, param_file, what_if=True, compiled=compiled
+        ),
+    ]
+    if strict_validate:
+        calls.append(
+            lambda: azure_ops.validate_template(
+                subscription_id, location, param_file, compiled=compiled
+            )
         )
+        print_step("Validating Bicep templates and running what-if analysis…")
+    else:
+        print_step("Running what-if analysis…")
+    with create_status("Analysing changes…"):
+        whatif_result, *validation = azure_ops.run_many(calls)
+    if validation:
+        if not validation[0].success:
+            print_error("Template validation failed")
+            print_deployment_result(validation[0])
+            raise typer.Exit(code=1)
+        print_success("Template validation passed")
+
     print_deployment_result(whatif_result)
     if not whatif_result.success:
         print_error("What-if analysis failed")
@@ -107,7 +133,7 @@ def deploy(
     # 6. Deploy
     print_step("Deploying infrastructure…")
     with create_status("Deploying — this may take several minutes…"):
-        result = azure_ops.run_deployment(subscription_id, location, param_file)
+        result = azure_ops.run_deployment(subscription_id, location, param_file, compiled=compiled)
     print_deployment_result(result)
 
     if result.success:
@@ -122,9 +148,10 @@ def what_if(
     subscription_id: SubscriptionOpt,
     location: LocationOpt = "eastus",
     param_file: ParamFileOpt = "infra/parameters/dev.bicepparam",
+    no_cache_prereq: NoCachePrereqOpt = False,
 ) -> None:
     """Run a what-if analysis to preview infrastructure changes."""
-    prereq = azure_ops.check_prerequisites()
+    prereq = azure_ops.check_prerequisites(use_cache=not no_cache_prereq)
     if not prereq.success:
         print_error(prereq.stderr)
         raise typer.Exit(code=1)
@@ -141,27 +168,32 @@ def what_if(
 @app.command()
 def destroy(
     subscription_id: SubscriptionOpt,
-    resource_group: Annotated[
-        str,
-        typer.Option("--resource-group", "-g", help="Name of the resource group to delete."),
+    resource_groups: Annotated[
+        list[str],
+        typer.Option(
+            "--resource-group",
+            "-g",
+            help="Name of a resource group to delete. Repeat to delete several.",
+        ),
     ],
     confirm: ConfirmOpt = True,
 ) -> None:
-    """Tear down infrastructure by deleting the resource group."""
-    if confirm and not confirm_action(
-        f"This will permanently delete resource group [bold]{resource_group}[/bold]. Continue?"
-    ):
+    """Tear down infrastructure by deleting one or more resource groups."""
+    names = ", ".join(f"[bold]{rg}[/bold]" for rg in resource_groups)
+    noun = "resource group" if len(resource_groups) == 1 else "resource groups"
+    if confirm and not confirm_action(f"This will permanently delete {noun} {names}. Continue?"):
         print_warning("Destroy cancelled by user")
         raise typer.Exit(code=0)
 
-    print_step(f"Deleting resource group [bold]{resource_group}[/bold]…")
+    print_step(f"Deleting {noun} {names}…")
     with create_status("Deleting…"):
-        result = azure_ops.delete_resource_group(subscription_id, resource_group)
+        result = azure_ops.delete_resource_groups(subscription_id, resource_groups)
 
+    quoted = ", ".join(f"'{rg}'" for rg in resource_groups)
     if result.success:
-        print_success(f"Resource group '{resource_group}' deletion initiated (--no-wait)")
+        print_success(f"Deletion of {noun} {quoted} initiated (--no-wait)")
     else:
-        print_error(f"Failed to delete resource group '{resource_group}'")
+        print_error(f"Failed to delete {noun} {quoted}")
         print_deployment_result(result)
         raise typer.Exit(code=1)
 
@@ -171,9 +203,10 @@ def validate(
     subscription_id: SubscriptionOpt,
     location: LocationOpt = "eastus",
     param_file: ParamFileOpt = "infra/parameters/dev.bicepparam",
+    no_cache_prereq: NoCachePrereqOpt = False,
 ) -> None:
     """Validate Bicep templates without deploying."""
-    prereq = azure_ops.check_prerequisites()
+    prereq = azure_ops.check_prerequisites(use_cache=not no_cache_prereq)
     if not prereq.success:
         print_error(prereq.stderr)
         raise typer.Exit(code=1)
@@ -198,9 +231,10 @@ def lint(
         str,
         typer.Option("--template-path", "-t", help="Path to the .bicep template to lint."),
     ] = "infra/main.bicep",
+    no_cache_prereq: NoCachePrereqOpt = False,
 ) -> None:
     """Lint Bicep templates using ``az bicep build``."""
-    prereq = azure_ops.check_prerequisites()
+    prereq = azure_ops.check_prerequisites(use_cache=not no_cache_prereq)
     if not prereq.success:
         print_error(prereq.stderr)
         raise typer.Exit(code=1)
@@ -5,15 +5,32 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
 from typing import Any
 from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
 import websockets
-from gateway.config import GatewayConfig
-from gateway.server import GatewayServer
+from gateway.config import GatewayConfig, load_config
+from gateway.server import GatewayServer, event_loop_factory
+
+# ---------------------------------------------------------------------------
+# Event loop
+# ---------------------------------------------------------------------------
+
+_LOOP_FACTORY = event_loop_factory()
+
+if _LOOP_FACTORY is not None:
+    # The hookspec only exists from pytest-asyncio 1.4; older versions keep the default loop
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(
+        config: pytest.Config, item: pytest.Item
+    ) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+        """Run async tests on uvloop when the ``fast`` extra is installed, as the gateway does."""
+        assert _LOOP_FACTORY is not None
+        return {"uvloop": _LOOP_FACTORY}
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers
@@ -33,6 +50,14 @@ async def auth_connect(url: str, token: str = "test-token") -> websockets.Client
     return ws
 
 
+@pytest.fixture(autouse=True)
+def _fresh_config() -> Iterator[None]:
+    """Drop the cached ``load_config()`` result so env changes take effect."""
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
+
+
 @pytest.fixture(autouse=True)
 def _no_real_session_resolver() -> Iterator[None]:
     """Prevent tests from reading the real ~/.openclaw sessions.json."""
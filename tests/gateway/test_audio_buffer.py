@@ -85,6 +85,54 @@ class TestToNumpy:
         assert arr[1] == pytest.approx(-32768.0 / 32768.0)  # -1.0
         assert arr[2] == pytest.approx(0.0)
 
+    def test_to_numpy_matches_divide_reference(self) -> None:
+        """Fused scale is bit-identical to astype(float32) / 32768 for every int16."""
+        buf = AudioBuffer(sample_rate=48_000)
+        full_range = np.arange(-32768, 32768, dtype=np.int16)
+        buf.append(full_range.tobytes())
+        expected = full_range.astype(np.float32) / 32768.0
+        np.testing.assert_array_equal(buf.to_numpy(), expected)
+
+    def test_to_numpy_concatenates_chunks(self) -> None:
+        """Samples from successive chunks come out in order."""
+        buf = AudioBuffer()
+        buf.append(_int16_bytes(1, 2))
+        buf.append(_int16_bytes(3))
+        assert buf.to_numpy().tolist() == pytest.approx([1 / 32768, 2 / 32768, 3 / 32768])
+
+    def test_to_numpy_result_survives_reset(self) -> None:
+        """Returned array does not alias the internal buffer."""
+        buf = AudioBuffer()
+        buf.append(_int16_bytes(16384))
+        arr = buf.to_numpy()
+        buf.reset()
+        buf.append(_int16_bytes(-16384))
+        assert arr[0] == pytest.approx(0.5)
+
+
+class TestStereoDownmix:
+    """Stereo PCM is averaged to mono by to_numpy()."""
+
+    def test_stereo_averaged_to_mono(self) -> None:
+        buf = AudioBuffer(channels=2)
+        buf.append(_int16_bytes(100, 300, -32768, -32768, 32767, 32767, 1, 0))
+        arr = buf.to_numpy()
+        assert arr.dtype == np.float32
+        assert arr.tolist() == [200 / 32768, -1.0, 32767 / 32768, 0.5 / 32768]
+
+    def test_stereo_matches_float_mean_reference(self) -> None:
+        rng = np.random.default_rng(0)
+        frames = rng.integers(-32768, 32768, size=(10_000, 2), dtype=np.int16)
+        buf = AudioBuffer(channels=2)
+        buf.append(frames.tobytes())
+        expected = (frames.astype(np.float64).mean(axis=1) / 32768.0).astype(np.float32)
+        np.testing.assert_array_equal(buf.to_numpy(), expected)
+
+    def test_trailing_partial_frame_dropped(self) -> None:
+        buf = AudioBuffer(channels=2)
+        buf.append(_int16_bytes(2, 4, 6))
+        assert buf.to_numpy().tolist() == [3 / 32768]
+
 
 class TestOverflow:
     """Tests for buffer overflow protection."""
@@ -120,6 +168,42 @@ class TestReset:
         assert buf.is_empty
         assert buf.duration_seconds == 0.0
 
+    def test_reset_then_reuse(self) -> None:
+        """Data appended after reset replaces the previous recording."""
+        buf = AudioBuffer()
+        buf.append(_int16_bytes(100, 200, 300))
+        buf.reset()
+        buf.append(_int16_bytes(-100))
+        assert buf.to_numpy().tolist() == pytest.approx([-100 / 32768])
+
+
+class TestReconfigure:
+    """Tests for in-place format changes between recordings."""
+
+    def test_reconfigure_clears_and_updates_format(self) -> None:
+        buf = AudioBuffer()
+        buf.append(_silence_bytes(3200))
+        buf.reconfigure(8_000, 2, 2)
+        assert buf.is_empty
+        assert (buf.sample_rate, buf.channels, buf.sample_width) == (8_000, 2, 2)
+        assert buf._max_bytes == 60 * 8_000 * 2 * 2
+
+    def test_reconfigure_smaller_keeps_storage(self) -> None:
+        buf = AudioBuffer(sample_rate=48_000)
+        storage = buf._buf
+        buf.reconfigure(8_000, 1, 2)
+        assert buf._buf is storage
+        # The smaller format's cap still applies
+        with pytest.raises(BufferOverflow):
+            buf.append(_silence_bytes(buf._max_bytes + 2))
+
+    def test_reconfigure_larger_grows_storage(self) -> None:
+        buf = AudioBuffer(sample_rate=8_000)
+        buf.reconfigure(48_000, 2, 2)
+        assert len(buf._buf) == 5 * 1024 * 1024
+        buf.append(_silence_bytes(5 * 1024 * 1024))
+        assert buf.duration_seconds == pytest.approx(5 * 1024 * 1024 / 192_000)
+
 
 class TestProperties:
     """Tests for duration_seconds and is_empty."""
@@ -181,8 +265,7 @@ class TestToNumpyGuard:
     def test_to_numpy_rejects_non_16bit(self) -> None:
         """to_numpy() raises ValueError when sample_width != 2."""
         buf = AudioBuffer(sample_width=3)
-        buf._chunks = [b"\x00" * 6]
-        buf._total_bytes = 6
+        buf.append(b"\x00" * 6)
         with pytest.raises(ValueError, match="requires sample_width=2"):
             buf.to_numpy()
 
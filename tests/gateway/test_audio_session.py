@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
 from gateway.audio_buffer import AudioBuffer
+from gateway.protocol import _INBOUND_FIELDS, ErrorCode
 from gateway.server import GatewaySession, SessionState
 from gateway.transcriber import TranscriptionError
 
@@ -27,17 +30,20 @@ class FakeWebSocket:
     def __init__(self, messages: list[str | bytes] | None = None) -> None:
         self._messages: list[str | bytes] = messages or []
         self._sent: list[str | bytes] = []
+        self._sent_parsed: list[dict[str, Any]] = []
         self._closed = False
         self._close_code: int | None = None
         self._close_reason: str | None = None
 
     @property
     def sent_frames(self) -> list[dict[str, Any]]:
-        """Parse all sent text frames as dicts."""
-        return [json.loads(m) for m in self._sent if isinstance(m, str)]
+        """All sent text frames, parsed once as they are sent."""
+        return self._sent_parsed
 
     async def send(self, data: str | bytes) -> None:
         self._sent.append(data)
+        if isinstance(data, str):
+            self._sent_parsed.append(json.loads(data))
 
     async def close(self, code: int = 1000, reason: str = "") -> None:
         self._closed = True
@@ -63,12 +69,14 @@ class MockTranscriber:
 
     def __init__(self, result: str | Exception = "test transcription") -> None:
         self._result: str | Exception = result
-        self._calls: list[np.ndarray] = []
+        self.call_count = 0
+        self.last_audio: np.ndarray | None = None
 
     async def transcribe(
         self, audio: np.ndarray, language: str = "en", timeout: float = 30.0
     ) -> str:
-        self._calls.append(audio)
+        self.call_count += 1
+        self.last_audio = audio
         if isinstance(self._result, Exception):
             raise self._result
         return self._result
@@ -161,6 +169,62 @@ class TestStartAudio:
         assert "busy" in errors[0]["detail"].lower()
 
 
+class TestDispatchTable:
+    """_dispatch routes every inbound frame type through GatewaySession._DISPATCH."""
+
+    async def test_every_inbound_type_has_handler(self) -> None:
+        session = GatewaySession(FakeWebSocket())  # type: ignore[arg-type]
+        assert set(GatewaySession._DISPATCH) == set(_INBOUND_FIELDS)
+        for _state, _detail, method_name in GatewaySession._DISPATCH.values():
+            assert callable(getattr(session, method_name))
+
+    async def test_unknown_type_returns_invalid_frame(self) -> None:
+        ws = FakeWebSocket()
+        session = GatewaySession(ws)  # type: ignore[arg-type]
+        await session._dispatch({"type": "bogus"})
+        assert ws.sent_frames[-1]["code"] == "INVALID_FRAME"
+
+    async def test_stop_audio_while_idle_returns_invalid_state(self) -> None:
+        ws = FakeWebSocket()
+        session = GatewaySession(ws)  # type: ignore[arg-type]
+        await session._dispatch({"type": "stop_audio"})
+        assert ws.sent_frames[-1] == {
+            "type": "error",
+            "detail": "Cannot stop audio — not recording",
+            "code": "INVALID_STATE",
+        }
+
+    async def test_status_request_allowed_in_any_state(self) -> None:
+        ws = FakeWebSocket()
+        session = GatewaySession(ws)  # type: ignore[arg-type]
+        session._state = SessionState.THINKING
+        await session._dispatch({"type": "status_request"})
+        assert ws.sent_frames[-1]["type"] == "status"
+
+
+class TestSendErrorAndIdle:
+    """_send_error_and_idle() resets the session and sends error then idle."""
+
+    async def test_resets_state_and_sends_both_frames(self) -> None:
+        ws = FakeWebSocket()
+        session = GatewaySession(ws)  # type: ignore[arg-type]
+        session._state = SessionState.TRANSCRIBING
+        session._current_question = "q"
+        session._task_start = 1.0
+
+        with patch("gateway.server.validate_outbound") as mock_validate:
+            await session._send_error_and_idle("Transcription failed", ErrorCode.TIMEOUT)
+
+        mock_validate.assert_not_called()
+        assert ws.sent_frames == [
+            {"type": "error", "detail": "Transcription failed", "code": "TIMEOUT"},
+            {"type": "status", "status": "idle"},
+        ]
+        assert session._state == SessionState.IDLE
+        assert session._current_question is None
+        assert session._task_start is None
+
+
 class TestBinaryData:
     async def test_binary_data_appended_to_buffer(self) -> None:
         """Binary data during RECORDING is appended to the audio buffer."""
@@ -185,6 +249,31 @@ class TestBinaryData:
         errors = [f for f in ws.sent_frames if f["type"] == "error"]
         assert len(errors) == 0
 
+    async def test_dropped_frames_warn_once(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Only the first dropped frame is a WARNING; the rest are DEBUG."""
+        pcm = _pcm_silence(3200)
+        ws = FakeWebSocket(messages=[pcm, pcm, pcm])
+        session = GatewaySession(ws)  # type: ignore[arg-type]
+        with caplog.at_level(logging.DEBUG, logger="gateway.server"):
+            await session.handle()
+
+        drops = [r for r in caplog.records if "Binary frame received" in r.getMessage()]
+        assert [r.levelno for r in drops] == [logging.WARNING, logging.DEBUG, logging.DEBUG]
+
+    async def test_drop_warning_rearmed_by_start_audio(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        session = GatewaySession(FakeWebSocket())  # type: ignore[arg-type]
+        with caplog.at_level(logging.WARNING, logger="gateway.server"):
+            await session._handle_binary(_pcm_silence())
+            await session._handle_start_audio(json.loads(_start_audio_frame()))
+            session._cancel_recording_timeout()
+            session._state = SessionState.IDLE
+            await session._handle_binary(_pcm_silence())
+
+        drops = [r for r in caplog.records if "Binary frame received" in r.getMessage()]
+        assert len(drops) == 2
+
 
 class TestStopAudio:
     async def test_stop_audio_triggers_transcription(self) -> None:
@@ -213,7 +302,7 @@ class TestStopAudio:
         assert statuses[-1] == "idle"
 
         # Transcriber should have been called once
-        assert len(transcriber._calls) == 1
+        assert transcriber.call_count == 1
 
     async def test_stop_audio_empty_buffer_returns_error(self) -> None:
         """start_audio then immediately stop_audio (no binary data) → error."""
@@ -380,62 +469,145 @@ class TestSessionStateEnum:
 class TestStartAudioValidation:
     """Tests for start_audio parameter validation (Issues 1 & 4)."""
 
-    async def test_unsupported_sample_width_returns_error(self) -> None:
-        """start_audio with sample_width != 2 → INVALID_FRAME error."""
-        ws = FakeWebSocket(messages=[_start_audio_frame(sample_width=4)])
+    @pytest.mark.parametrize(
+        ("kwargs", "detail_substr"),
+        [
+            pytest.param({"sample_width": 4}, "sample width", id="sample_width"),
+            pytest.param({"sample_rate": 0}, "sample rate", id="sample_rate_zero"),
+            pytest.param({"sample_rate": 96_000}, "sample rate", id="sample_rate_too_high"),
+            pytest.param({"channels": 0}, "channels", id="channels"),
+        ],
+    )
+    async def test_invalid_params_return_error(
+        self, kwargs: dict[str, int], detail_substr: str
+    ) -> None:
+        """Out-of-range start_audio params → INVALID_FRAME error, session stays idle."""
+        ws = FakeWebSocket(messages=[_start_audio_frame(**kwargs)])
         session = GatewaySession(ws)  # type: ignore[arg-type]
         await session.handle()
 
         errors = [f for f in ws.sent_frames if f["type"] == "error"]
         assert len(errors) == 1
         assert errors[0]["code"] == "INVALID_FRAME"
-        assert "sample width" in errors[0]["detail"].lower()
+        assert detail_substr in errors[0]["detail"].lower()
         # Session should remain idle (not transition to recording)
         assert session._state == SessionState.IDLE
 
-    async def test_invalid_sample_rate_returns_error(self) -> None:
-        """start_audio with sample_rate=0 → INVALID_FRAME error."""
-        ws = FakeWebSocket(messages=[_start_audio_frame(sample_rate=0)])
+    async def test_valid_params_accepted(self) -> None:
+        """start_audio with valid params transitions to recording."""
+        ws = FakeWebSocket(
+            messages=[_start_audio_frame(sample_rate=44_100, channels=2, sample_width=2)]
+        )
         session = GatewaySession(ws)  # type: ignore[arg-type]
         await session.handle()
 
-        errors = [f for f in ws.sent_frames if f["type"] == "error"]
-        assert len(errors) == 1
-        assert errors[0]["code"] == "INVALID_FRAME"
-        assert "sample rate" in errors[0]["detail"].lower()
+        statuses = [f for f in ws.sent_frames if f["type"] == "status"]
+        assert {"type": "status", "status": "recording"} in statuses
 
-    async def test_invalid_sample_rate_too_high_returns_error(self) -> None:
-        """start_audio with sample_rate > 48000 → INVALID_FRAME error."""
-        ws = FakeWebSocket(messages=[_start_audio_frame(sample_rate=96_000)])
-        session = GatewaySession(ws)  # type: ignore[arg-type]
-        await session.handle()
 
-        errors = [f for f in ws.sent_frames if f["type"] == "error"]
-        assert len(errors) == 1
-        assert errors[0]["code"] == "INVALID_FRAME"
-        assert "sample rate" in errors[0]["detail"].lower()
+class TestRecordingTimeout:
+    """A one-shot timer auto-stops recordings that exceed the wall-clock cap (M-4)."""
 
-    async def test_invalid_channels_returns_error(self) -> None:
-        """start_audio with channels=0 → INVALID_FRAME error."""
-        ws = FakeWebSocket(messages=[_start_audio_frame(channels=0)])
+    async def test_start_audio_arms_timer(self) -> None:
+        session = GatewaySession(FakeWebSocket())  # type: ignore[arg-type]
+        await session._handle_start_audio(json.loads(_start_audio_frame()))
+        assert session._recording_timer is not None
+        session._cancel_recording_timeout()
+
+    async def test_timeout_stops_recording(self) -> None:
+        ws = FakeWebSocket()
         session = GatewaySession(ws)  # type: ignore[arg-type]
-        await session.handle()
+        with patch("gateway.server._MAX_RECORDING_SECONDS", 0.01):
+            await session._handle_start_audio(json.loads(_start_audio_frame()))
+        await session._handle_binary(_pcm_silence())
+        await asyncio.sleep(0.05)
 
         errors = [f for f in ws.sent_frames if f["type"] == "error"]
         assert len(errors) == 1
-        assert errors[0]["code"] == "INVALID_FRAME"
-        assert "channels" in errors[0]["detail"].lower()
-
-    async def test_valid_params_accepted(self) -> None:
-        """start_audio with valid params transitions to recording."""
-        ws = FakeWebSocket(
-            messages=[_start_audio_frame(sample_rate=44_100, channels=2, sample_width=2)]
-        )
+        assert errors[0]["code"] == "BUFFER_OVERFLOW"
+        assert ws.sent_frames[-1] == {"type": "status", "status": "idle"}
+        assert session._state == SessionState.IDLE
+        assert session._audio_buffer is not None
+        assert session._audio_buffer.is_empty
+
+    async def test_stop_audio_cancels_timer(self) -> None:
+        session = GatewaySession(FakeWebSocket(), transcriber=MockTranscriber())  # type: ignore[arg-type]
+        await session._handle_start_audio(json.loads(_start_audio_frame()))
+        await session._handle_binary(_pcm_silence())
+        await session._handle_stop_audio()
+        assert session._recording_timer is None
+
+    async def test_stale_timer_ignored(self) -> None:
+        """A timer from a previous recording does not stop the next one."""
+        ws = FakeWebSocket()
         session = GatewaySession(ws)  # type: ignore[arg-type]
-        await session.handle()
+        await session._handle_start_audio(json.loads(_start_audio_frame()))
+        old_generation = session._recording_generation
+        session._state = SessionState.IDLE
+        await session._handle_start_audio(json.loads(_start_audio_frame()))
+
+        session._on_recording_timeout(old_generation)
+        await asyncio.sleep(0)
+
+        assert session._state == SessionState.RECORDING
+        assert not [f for f in ws.sent_frames if f["type"] == "error"]
+        session._cancel_recording_timeout()
+
+    async def test_stop_audio_after_timer_fires_wins(self) -> None:
+        """stop_audio handled before the timeout task runs keeps its recording."""
+
+        class YieldingTranscriber(MockTranscriber):
+            async def transcribe(
+                self, audio: np.ndarray, language: str = "en", timeout: float = 30.0
+            ) -> str:
+                await asyncio.sleep(0)  # let the pending timeout task run mid-transcription
+                return await super().transcribe(audio, language, timeout)
+
+        ws = FakeWebSocket()
+        transcriber = YieldingTranscriber(result="hello")
+        session = GatewaySession(ws, transcriber=transcriber)  # type: ignore[arg-type]
+        await session._handle_start_audio(json.loads(_start_audio_frame()))
+        await session._handle_binary(_pcm_silence())
+
+        session._cancel_recording_timeout()
+        session._on_recording_timeout(session._recording_generation)
+        timeout_task = session._recording_timeout_task
+        assert timeout_task is not None
+        await session._dispatch(json.loads(_stop_audio_frame()))
+        await timeout_task
+
+        assert not [f for f in ws.sent_frames if f["type"] == "error"]
+        assert {"type": "transcription", "text": "hello"} in ws.sent_frames
+        assert ws.sent_frames[-1] == {"type": "status", "status": "idle"}
+        assert transcriber.call_count == 1
+        assert transcriber.last_audio is not None and transcriber.last_audio.size > 0
+
+    async def test_buffer_reused_across_recordings(self) -> None:
+        session = GatewaySession(FakeWebSocket(), transcriber=MockTranscriber())  # type: ignore[arg-type]
+        await session._handle_start_audio(json.loads(_start_audio_frame()))
+        first = session._audio_buffer
+        await session._handle_binary(_pcm_silence())
+        await session._handle_stop_audio()
+
+        assert session._audio_buffer is first
+        assert first is not None and first.is_empty
+
+        await session._handle_start_audio(json.loads(_start_audio_frame(sample_rate=8_000)))
+        assert session._audio_buffer is first
+        assert first.sample_rate == 8_000
+        session._cancel_recording_timeout()
+
+    async def test_binary_before_timeout_is_buffered(self) -> None:
+        ws = FakeWebSocket()
+        session = GatewaySession(ws)  # type: ignore[arg-type]
+        await session._handle_start_audio(json.loads(_start_audio_frame()))
 
-        statuses = [f for f in ws.sent_frames if f["type"] == "status"]
-        assert {"type": "status", "status": "recording"} in statuses
+        await session._handle_binary(_pcm_silence())
+
+        assert session._audio_buffer is not None
+        assert not session._audio_buffer.is_empty
+        assert session._state == SessionState.RECORDING
+        session._cancel_recording_timeout()
 
 
 class TestOddByteChunk:
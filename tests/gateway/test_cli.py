@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import io
 import json
+import socket
 import subprocess
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -13,6 +16,7 @@ from gateway.cli import (
     _choose_whisper_model,
     _detect_gpu,
     _get_local_ip,
+    _has_nvidia_pci,
     _parse_gpu_output,
     _read_openclaw_config,
     _render_env,
@@ -56,12 +60,62 @@ class TestParseGpuOutput:
         assert name == "GPU Name"
         assert vram == 0.0
 
+    def test_multiple_gpus_uses_first_line(self) -> None:
+        name, vram = _parse_gpu_output("\nGPU A, 4096 MiB\nGPU B, 8192 MiB\n")
+        assert name == "GPU A"
+        assert vram == pytest.approx(4.0, abs=0.1)
+
+    def test_mib_only_stripped_as_suffix(self) -> None:
+        name, vram = _parse_gpu_output("Mibble GPU, 1024mib\n")
+        assert name == "Mibble GPU"
+        assert vram == pytest.approx(1.0, abs=0.1)
+
+
+class TestHasNvidiaPci:
+    """_has_nvidia_pci scans sysfs PCI vendor IDs."""
+
+    def _add_device(self, root: Path, slot: str, vendor: str) -> None:
+        dev = root / slot
+        dev.mkdir(parents=True)
+        (dev / "vendor").write_text(f"{vendor}\n")
+
+    def test_nvidia_device_present(self, tmp_path: Path) -> None:
+        self._add_device(tmp_path, "0000:00:02.0", "0x8086")
+        self._add_device(tmp_path, "0000:01:00.0", "0x10de")
+        assert _has_nvidia_pci(tmp_path) is True
+
+    def test_no_nvidia_device(self, tmp_path: Path) -> None:
+        self._add_device(tmp_path, "0000:00:02.0", "0x8086")
+        self._add_device(tmp_path, "0000:03:00.0", "0x1002")
+        assert _has_nvidia_pci(tmp_path) is False
+
+    def test_missing_sysfs_root(self, tmp_path: Path) -> None:
+        assert _has_nvidia_pci(tmp_path / "does-not-exist") is False
+
 
 class TestDetectGpu:
     """_detect_gpu calls nvidia-smi and interprets the result."""
 
+    @pytest.fixture(autouse=True)
+    def _nvidia_pci_present(self) -> Iterator[None]:
+        with patch("gateway.cli._has_nvidia_pci", return_value=True):
+            yield
+
+    def test_no_nvidia_pci_skips_nvidia_smi(self) -> None:
+        with (
+            patch("gateway.cli.sys.platform", "linux"),
+            patch("gateway.cli._WSL_GPU_DEVICE", Path("/nonexistent/dxg")),
+            patch("gateway.cli._has_nvidia_pci", return_value=False),
+            patch("gateway.cli.subprocess.run") as mock_run,
+        ):
+            name, vram = _detect_gpu()
+            mock_run.assert_not_called()
+        assert name is None
+        assert vram == 0.0
+
     def test_gpu_found(self) -> None:
-        fake = MagicMock(
+        fake = subprocess.CompletedProcess(
+            args=["nvidia-smi"],
             returncode=0,
             stdout="NVIDIA RTX 4090, 24564 MiB\n",
         )
@@ -78,7 +132,7 @@ class TestDetectGpu:
         assert vram == 0.0
 
     def test_nvidia_smi_nonzero_exit(self) -> None:
-        fake = MagicMock(returncode=1, stdout="")
+        fake = subprocess.CompletedProcess(args=["nvidia-smi"], returncode=1, stdout="")
         with patch("gateway.cli.subprocess.run", return_value=fake):
             name, vram = _detect_gpu()
         assert name is None
@@ -102,26 +156,20 @@ class TestDetectGpu:
 class TestChooseWhisperModel:
     """_choose_whisper_model picks appropriate model for VRAM."""
 
-    def test_no_gpu(self) -> None:
-        assert _choose_whisper_model(0.0, has_gpu=False) == "tiny.en"
-
-    def test_low_vram(self) -> None:
-        assert _choose_whisper_model(2.0, has_gpu=True) == "base.en"
-
-    def test_medium_vram(self) -> None:
-        assert _choose_whisper_model(6.0, has_gpu=True) == "small.en"
-
-    def test_high_vram(self) -> None:
-        assert _choose_whisper_model(12.0, has_gpu=True) == "medium.en"
-
-    def test_boundary_4gb(self) -> None:
-        assert _choose_whisper_model(4.0, has_gpu=True) == "small.en"
-
-    def test_boundary_8gb(self) -> None:
-        assert _choose_whisper_model(8.0, has_gpu=True) == "medium.en"
-
-    def test_boundary_just_under_4gb(self) -> None:
-        assert _choose_whisper_model(3.99, has_gpu=True) == "base.en"
+    @pytest.mark.parametrize(
+        ("vram_gb", "has_gpu", "expected"),
+        [
+            pytest.param(0.0, False, "tiny.en", id="no_gpu"),
+            pytest.param(2.0, True, "base.en", id="low_vram"),
+            pytest.param(6.0, True, "small.en", id="medium_vram"),
+            pytest.param(12.0, True, "medium.en", id="high_vram"),
+            pytest.param(4.0, True, "small.en", id="boundary_4gb"),
+            pytest.param(8.0, True, "medium.en", id="boundary_8gb"),
+            pytest.param(3.99, True, "base.en", id="boundary_just_under_4gb"),
+        ],
+    )
+    def test_choose(self, vram_gb: float, has_gpu: bool, expected: str) -> None:
+        assert _choose_whisper_model(vram_gb, has_gpu=has_gpu) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -168,6 +216,13 @@ class TestReadOpenClawConfig:
         assert token is None
         assert port == 18789
 
+    def test_invalid_utf8(self, tmp_path: Path) -> None:
+        p = tmp_path / "openclaw.json"
+        p.write_bytes(b'{"gateway": {"port": "\xff"}}')
+        token, port = _read_openclaw_config(p)
+        assert token is None
+        assert port == 18789
+
 
 # ---------------------------------------------------------------------------
 # .env rendering
@@ -239,7 +294,7 @@ class TestRenderEnv:
 class TestEnvParseable:
     """Generated .env must be parseable by python-dotenv."""
 
-    def test_dotenv_loads_all_keys(self, tmp_path: Path) -> None:
+    def test_dotenv_loads_all_keys(self) -> None:
         content = _render_env(
             local_ip="192.168.1.42",
             gateway_token="tok123",
@@ -250,9 +305,7 @@ class TestEnvParseable:
             openclaw_port=18789,
             openclaw_token="oc-abc",
         )
-        env_file = tmp_path / ".env"
-        env_file.write_text(content)
-        values = dotenv_values(env_file)
+        values = dotenv_values(stream=io.StringIO(content))
         assert values["GATEWAY_HOST"] == "0.0.0.0"
         assert values["GATEWAY_PORT"] == "8765"
         assert values["GATEWAY_TOKEN"] == "tok123"
@@ -448,12 +501,43 @@ class TestInitEnvG2App:
 class TestGetLocalIp:
     """_get_local_ip falls back gracefully."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> Iterator[None]:
+        _get_local_ip.cache_clear()
+        yield
+        _get_local_ip.cache_clear()
+
     def test_returns_string(self) -> None:
         ip = _get_local_ip()
         assert isinstance(ip, str)
         parts = ip.split(".")
         assert len(parts) == 4
 
+    def test_fallback_requests_ipv4_only(self) -> None:
+        infos = [(2, 2, 17, "", ("192.168.5.7", 0))]
+        with (
+            patch("gateway.cli.socket.socket", side_effect=OSError),
+            patch("gateway.cli.socket.getaddrinfo", return_value=infos) as mock_gai,
+        ):
+            assert _get_local_ip() == "192.168.5.7"
+        assert mock_gai.call_args.kwargs["family"] == socket.AF_INET
+
+    def test_fallback_resolution_failure(self) -> None:
+        with (
+            patch("gateway.cli.socket.socket", side_effect=OSError),
+            patch("gateway.cli.socket.getaddrinfo", side_effect=socket.gaierror),
+        ):
+            assert _get_local_ip() == "127.0.0.1"
+
+    def test_result_is_cached(self) -> None:
+        with (
+            patch("gateway.cli.socket.socket", side_effect=OSError),
+            patch("gateway.cli.socket.getaddrinfo", side_effect=socket.gaierror) as mock_gai,
+        ):
+            _get_local_ip()
+            _get_local_ip()
+        mock_gai.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # push-config command
@@ -18,6 +18,10 @@ class TestGatewayConfigDefaults:
         with pytest.raises(AttributeError):
             cfg.gateway_port = 9999  # type: ignore[misc]
 
+    def test_slotted(self) -> None:
+        cfg = GatewayConfig()
+        assert not hasattr(cfg, "__dict__")
+
     def test_config_defaults_include_whisper(self) -> None:
         cfg = GatewayConfig()
         assert cfg.whisper_model == "base.en"
@@ -82,6 +86,21 @@ class TestLoadConfig:
         assert cfg.whisper_device == "cpu"
         assert cfg.whisper_compute_type == "int8"
 
+    def test_result_is_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("GATEWAY_PORT", "9000")
+        first = load_config()
+        monkeypatch.setenv("GATEWAY_PORT", "9001")
+
+        assert load_config() is first
+
+    def test_cache_clear_reloads(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("GATEWAY_PORT", "9000")
+        load_config()
+        monkeypatch.setenv("GATEWAY_PORT", "9001")
+        load_config.cache_clear()
+
+        assert load_config().gateway_port == 9001
+
 
 class TestOpenClawConfigDefaults:
     """OpenClaw-related config defaults."""
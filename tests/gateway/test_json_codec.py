@@ -0,0 +1,32 @@
+"""Tests for gateway.json_codec."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from gateway import json_codec
+
+
+class TestJsonCodec:
+    """dumps/loads behave identically with or without orjson."""
+
+    def test_round_trip(self) -> None:
+        frame = {"type": "assistant", "delta": 'héllo "world"\n'}
+        assert json_codec.loads(json_codec.dumps(frame)) == frame
+
+    def test_dumps_is_compact_str(self) -> None:
+        out = json_codec.dumps({"type": "end", "n": 1})
+        assert isinstance(out, str)
+        assert json.loads(out) == {"type": "end", "n": 1}
+        assert " " not in out
+
+    def test_loads_accepts_bytes(self) -> None:
+        assert json_codec.loads(b'{"type":"pong"}') == {"type": "pong"}
+
+    def test_invalid_json_raises_stdlib_decode_error(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads("{not json")
+
+    def test_decode_error_alias(self) -> None:
+        assert json_codec.JSONDecodeError is json.JSONDecodeError
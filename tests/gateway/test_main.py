@@ -0,0 +1,63 @@
+"""Tests for the ``python -m gateway`` entry point."""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+_CLI_ONLY_MODULES = re.compile(r"\|\s+(typer|click|rich)(\.|\s*$)", re.MULTILINE)
+
+# Run the real ``python -m gateway`` dispatch with no subcommand, but swap
+# the server coroutine for a no-op so nothing binds a socket.
+_SERVER_ENTRY = """
+import sys
+import gateway.server
+
+async def _noop():
+    pass
+
+gateway.server.main = _noop
+sys.argv = ["gateway"]
+
+import runpy
+runpy.run_module("gateway", run_name="__main__")
+"""
+
+
+def _imported_modules(code: str) -> str:
+    """Run *code* under ``-X importtime`` and return the import log."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=_PROJECT_ROOT,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stderr
+
+
+class TestServerImportPath:
+    """The server path must not pull in the CLI-only typer/click/rich stack."""
+
+    def test_server_module_does_not_import_cli_stack(self) -> None:
+        log = _imported_modules("import gateway.server")
+        assert _CLI_ONLY_MODULES.search(log) is None
+
+    def test_package_init_does_not_import_cli_stack(self) -> None:
+        log = _imported_modules("import gateway")
+        assert _CLI_ONLY_MODULES.search(log) is None
+
+    def test_main_dispatch_without_subcommand_skips_cli_stack(self) -> None:
+        log = _imported_modules(_SERVER_ENTRY)
+        assert _CLI_ONLY_MODULES.search(log) is None
+        assert re.search(r"\|\s+gateway\.server\s*$", log, re.MULTILINE)
+
+    def test_cli_subcommand_loads_typer(self) -> None:
+        """Sanity check that the import log pattern detects the CLI stack."""
+        log = _imported_modules("import gateway.cli")
+        assert _CLI_ONLY_MODULES.search(log) is not None
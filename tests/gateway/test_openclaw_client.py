@@ -6,11 +6,12 @@ import asyncio
 import json
 import secrets
 from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import pytest
 import websockets
 from gateway.device_identity import DeviceIdentity, _generate_identity
-from gateway.openclaw_client import OpenClawClient, OpenClawError
+from gateway.openclaw_client import OpenClawClient, OpenClawError, _encode_agent_request
 from websockets import ServerConnection
 from websockets.asyncio.server import Server
 
@@ -40,6 +41,7 @@ async def _mock_openclaw_handler(
     error_on_agent: bool = False,
     disconnect_mid_stream: bool = False,
     send_challenge: bool = True,
+    seen_ids: list[str] | None = None,
 ) -> None:
     """Simple handler that mimics OpenClaw protocol.
 
@@ -64,6 +66,8 @@ async def _mock_openclaw_handler(
 
     async for raw in ws:
         msg = json.loads(raw)
+        if seen_ids is not None:
+            seen_ids.append(msg["id"])
         if msg["method"] == "connect":
             if auth_ok:
                 await ws.send(
@@ -168,6 +172,35 @@ def _make_client(port: int, token: str = "test-token") -> OpenClawClient:
 # ---------------------------------------------------------------------------
 
 
+class TestSlots:
+    async def test_no_instance_dict(self) -> None:
+        client = _make_client(1)
+        assert not hasattr(client, "__dict__")
+
+
+class TestEncodeAgentRequest:
+    async def test_matches_dict_encoding(self) -> None:
+        frame = json.loads(_encode_agent_request(7, "hello", "agent:claw:g2"))
+        key = frame["params"].pop("idempotencyKey")
+        assert frame == {
+            "type": "req",
+            "id": "7",
+            "method": "agent",
+            "params": {"message": "hello", "sessionKey": "agent:claw:g2"},
+        }
+        assert len(key) == 36
+
+    async def test_escapes_text(self) -> None:
+        text = 'say "hi"\nthen \\ 100% done ✓'
+        frame = json.loads(_encode_agent_request(1, text, "s"))
+        assert frame["params"]["message"] == text
+
+    async def test_idempotency_key_is_unique(self) -> None:
+        first = json.loads(_encode_agent_request(1, "a", "s"))
+        second = json.loads(_encode_agent_request(1, "a", "s"))
+        assert first["params"]["idempotencyKey"] != second["params"]["idempotencyKey"]
+
+
 class TestHappyPath:
     async def test_connect_auth_and_stream_deltas(self) -> None:
         server, port = await _start_mock_server(deltas=["Hello ", "world!"])
@@ -202,21 +235,22 @@ class TestHappyPath:
 
     async def test_request_ids_increment(self) -> None:
         """Request IDs reset per connection (each send_message reconnects)."""
-        server, port = await _start_mock_server(deltas=["x"])
+        seen_ids: list[str] = []
+        server, port = await _start_mock_server(deltas=["x"], seen_ids=seen_ids)
         try:
             client = _make_client(port)
             # After ensure_connected, auth used id=1
             await client.ensure_connected()
-            assert client._next_id == 2  # 1 consumed by auth
+            assert seen_ids == ["1"]
 
             stream = await client.send_message("msg1")
             _ = [d async for d in stream]
-            assert client._next_id == 3  # 2 consumed by agent (ws closed)
+            assert seen_ids == ["1", "2"]  # agent=2 (ws closed after stream)
 
             # Second message triggers reconnect → IDs reset
             stream2 = await client.send_message("msg2")
             _ = [d async for d in stream2]
-            assert client._next_id == 3  # auth=1, agent=2 on fresh conn
+            assert seen_ids == ["1", "2", "1", "2"]  # auth=1, agent=2 on fresh conn
 
             await client.close()
         finally:
@@ -489,6 +523,75 @@ class TestConnectionErrors:
             await server.wait_closed()
 
 
+def _refused_port() -> int:
+    """Return a localhost port with nothing listening on it."""
+    import socket as _socket
+
+    with _socket.socket(_socket.AF_INET, _socket.SOCK_STREAM) as _s:
+        _s.bind(("127.0.0.1", 0))
+        port: int = _s.getsockname()[1]
+    return port
+
+
+class TestReconnectBackoff:
+    async def test_first_attempt_is_not_delayed(self) -> None:
+        client = _make_client(_refused_port())
+        with (
+            patch("gateway.openclaw_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            pytest.raises(OpenClawError, match="connection refused"),
+        ):
+            await client.ensure_connected()
+        mock_sleep.assert_not_awaited()
+
+    async def test_backoff_doubles_after_each_failure(self) -> None:
+        client = _make_client(_refused_port())
+        delays: list[float] = []
+        with (
+            patch("gateway.openclaw_client.random.uniform", return_value=0.0),
+            patch(
+                "gateway.openclaw_client.asyncio.sleep",
+                new=AsyncMock(side_effect=lambda d: delays.append(d)),
+            ),
+        ):
+            for _ in range(4):
+                with pytest.raises(OpenClawError):
+                    await client.ensure_connected()
+        assert delays == pytest.approx([0.1, 0.2, 0.4])
+
+    async def test_backoff_is_capped(self) -> None:
+        client = _make_client(_refused_port())
+        with patch("gateway.openclaw_client.asyncio.sleep", new_callable=AsyncMock):
+            for _ in range(10):
+                with pytest.raises(OpenClawError):
+                    await client.ensure_connected()
+        assert client._backoff == pytest.approx(5.0)
+
+    async def test_success_resets_backoff(self) -> None:
+        server, port = await _start_mock_server()
+        try:
+            client = _make_client(port)
+            client._backoff = 0.4
+            with patch("gateway.openclaw_client.asyncio.sleep", new_callable=AsyncMock):
+                await client.ensure_connected()
+            assert client._backoff == 0.0
+            await client.close()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    async def test_concurrent_callers_share_one_handshake(self) -> None:
+        seen_ids: list[str] = []
+        server, port = await _start_mock_server(seen_ids=seen_ids)
+        try:
+            client = _make_client(port)
+            await asyncio.gather(client.ensure_connected(), client.ensure_connected())
+            assert seen_ids == ["1"]
+            await client.close()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+
 class TestClose:
     async def test_graceful_close(self) -> None:
         server, port = await _start_mock_server()
@@ -1,10 +1,13 @@
 """Tests for gateway.protocol."""
 
 import json
+import sys
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from gateway.protocol import (
+    ErrorCode,
     ProtocolError,
     parse_text_frame,
     serialize,
@@ -48,6 +51,14 @@ class TestRoundTripFrames:
         serialized = serialize(frame)
         assert json.loads(serialized) == frame
 
+    def test_serialize_returns_text(self) -> None:
+        """str output keeps frames on the WebSocket text channel."""
+        assert isinstance(serialize({"type": "end"}), str)
+
+    def test_serialize_error_code_enum(self) -> None:
+        frame = {"type": "error", "detail": "x", "code": ErrorCode.TIMEOUT}
+        assert json.loads(serialize(frame))["code"] == "TIMEOUT"
+
 
 class TestParseErrors:
     """parse_text_frame rejects malformed input."""
@@ -109,6 +120,15 @@ class TestValidateOutbound:
         with pytest.raises(ProtocolError, match="must be a dict"):
             validate_outbound("not a dict")  # type: ignore[arg-type]
 
+    def test_extra_key_in_place_of_required_reports_missing(self) -> None:
+        """Same key count as a valid frame, but the required field is absent."""
+        with pytest.raises(ProtocolError, match="missing required field 'delta'"):
+            validate_outbound({"type": "assistant", "text": "hi"})
+
+    def test_mistyped_optional_field_with_required_present(self) -> None:
+        with pytest.raises(ProtocolError, match="Field 'phase' must be str"):
+            validate_outbound({"type": "status", "status": "idle", "phase": 1})
+
 
 class TestInboundOnly:
     """parse_text_frame only accepts inbound frame types."""
@@ -216,6 +236,38 @@ class TestHistoryFrame:
             validate_outbound({"type": "history"})
 
 
+class TestLiteralInboundFrames:
+    """Field-less inbound frames in compact form skip the JSON parse."""
+
+    @pytest.mark.parametrize(
+        "frame_type", ["pong", "stop_audio", "status_request", "reset_session"]
+    )
+    def test_compact_literal_skips_json_parse(self, frame_type: str) -> None:
+        raw = json.dumps({"type": frame_type}, separators=(",", ":"))
+        with patch("gateway.protocol.json_codec.loads") as mock_loads:
+            assert parse_text_frame(raw) == {"type": frame_type}
+        mock_loads.assert_not_called()
+
+    def test_literal_returns_fresh_dict(self) -> None:
+        first = parse_text_frame('{"type":"pong"}')
+        first["extra"] = 1
+        assert parse_text_frame('{"type":"pong"}') == {"type": "pong"}
+
+    def test_non_literal_spelling_still_parses(self) -> None:
+        assert parse_text_frame('{ "type": "stop_audio", "hilText": "hi" }') == {
+            "type": "stop_audio",
+            "hilText": "hi",
+        }
+
+
+class TestInternedFrameType:
+    """Parsed frames carry the interned type string."""
+
+    def test_type_is_interned(self) -> None:
+        raw = '{"type": "start_audio", "sampleRate": 16000, "channels": 1, "sampleWidth": 2}'
+        assert parse_text_frame(raw)["type"] is sys.intern("start_audio")
+
+
 class TestStatusRequestFrame:
     """status_request inbound frame validation."""
 
@@ -5,13 +5,31 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import socket
 from collections.abc import Iterator
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from urllib.parse import urlparse
 
 import pytest
 import websockets
-from gateway.server import GatewayServer, SessionState, main
+from gateway.config import GatewayConfig
+from gateway.protocol import ErrorCode, ProtocolError, serialize
+from gateway.server import (
+    _CONNECTED_FRAME,
+    _END_FRAME,
+    _STATUS_FRAMES,
+    GatewayServer,
+    GatewaySession,
+    SessionState,
+    _DeltaBatcher,
+    _encode_assistant_delta,
+    _encode_error,
+    _has_query_token,
+    _set_tcp_nodelay,
+    event_loop_factory,
+    main,
+)
 from gateway.session_resolver import SessionMeta
 
 from tests.gateway.conftest import auth_connect as _auth_connect
@@ -51,6 +69,25 @@ class TestConnection:
             with pytest.raises(websockets.ConnectionClosedError):
                 await ws.recv()
 
+    async def test_binary_auth_frame_accepted(
+        self, auth_gateway: tuple[str, GatewayServer]
+    ) -> None:
+        url, _ = auth_gateway
+        async with websockets.connect(url) as ws:
+            await ws.send(b"\x01test-token")
+            connected = await _recv_json(ws)
+            assert connected == {"type": "connected", "version": "1.0"}
+
+    @pytest.mark.parametrize("frame", [b"\x01wrong", b"test-token", b"\x02test-token", b""])
+    async def test_bad_binary_auth_frame_rejected(
+        self, auth_gateway: tuple[str, GatewayServer], frame: bytes
+    ) -> None:
+        url, _ = auth_gateway
+        async with websockets.connect(url) as ws:
+            await ws.send(frame)
+            with pytest.raises(websockets.ConnectionClosedError):
+                await ws.recv()
+
 
 class TestTextMessage:
     """Sending a text message triggers mock response flow."""
@@ -74,17 +111,12 @@ class TestTextMessage:
             streaming = await _recv_json(ws)
             assert streaming == {"type": "status", "status": "streaming"}
 
-            deltas: list[str] = []
-            for _ in range(3):
-                frame = await _recv_json(ws)
-                assert frame["type"] == "assistant"
-                deltas.append(frame["delta"])
-
-            assert deltas == [
-                "This is a ",
-                "mock response ",
-                "from the gateway.",
-            ]
+            # The canned deltas arrive together, so they are coalesced
+            delta = await _recv_json(ws)
+            assert delta == {
+                "type": "assistant",
+                "delta": "This is a mock response from the gateway.",
+            }
 
             end = await _recv_json(ws)
             assert end == {"type": "end"}
@@ -244,6 +276,7 @@ class TestMainTranscriber:
     ) -> None:
         mock_config, mock_gw_cls, mock_server = main_mocks
         mock_transcriber = MagicMock()
+        mock_transcriber.warmup = AsyncMock()
 
         with patch(
             "gateway.server.Transcriber",
@@ -257,6 +290,8 @@ class TestMainTranscriber:
                 transcriber=mock_transcriber,
             )
             mock_server.serve.assert_awaited_once()
+            mock_transcriber.warmup.assert_awaited_once_with()
+            mock_transcriber.close.assert_called_once_with()
 
     async def test_main_falls_back_when_faster_whisper_missing(
         self,
@@ -304,6 +339,246 @@ class TestMainTranscriber:
             mock_server.serve.assert_awaited_once()
             assert "Failed to load transcriber" in caplog.text
 
+    async def test_main_serves_when_warmup_fails(
+        self,
+        main_mocks: tuple[MagicMock, MagicMock, AsyncMock],
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        mock_config, mock_gw_cls, mock_server = main_mocks
+        mock_transcriber = MagicMock()
+        mock_transcriber.warmup = AsyncMock(side_effect=RuntimeError("kernel init failed"))
+
+        with (
+            patch("gateway.server.Transcriber", return_value=mock_transcriber),
+            caplog.at_level(logging.WARNING, logger="gateway.server"),
+        ):
+            await main()
+
+            mock_gw_cls.assert_called_once_with(mock_config, transcriber=mock_transcriber)
+            mock_server.serve.assert_awaited_once()
+            assert "warm-up failed" in caplog.text
+
+
+class TestSetTcpNodelay:
+    """_set_tcp_nodelay() tunes TCP sockets and tolerates non-TCP transports."""
+
+    async def test_sets_nodelay(self) -> None:
+        ws = MagicMock()
+        sock = ws.transport.get_extra_info.return_value
+        _set_tcp_nodelay(ws)
+        sock.setsockopt.assert_called_once_with(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    async def test_no_socket(self) -> None:
+        ws = MagicMock()
+        ws.transport.get_extra_info.return_value = None
+        _set_tcp_nodelay(ws)
+
+    async def test_unsupported_socket(self) -> None:
+        ws = MagicMock()
+        ws.transport.get_extra_info.return_value.setsockopt.side_effect = OSError("not TCP")
+        _set_tcp_nodelay(ws)
+
+    async def test_applied_to_accepted_connections(
+        self, auth_gateway: tuple[str, GatewayServer]
+    ) -> None:
+        url, _ = auth_gateway
+        with patch("gateway.server._set_tcp_nodelay") as mock_nodelay:
+            ws = await _auth_connect(url)
+            async with ws:
+                await ws.recv()  # connected
+        mock_nodelay.assert_called_once()
+
+
+class TestDeltaBatcher:
+    """_DeltaBatcher coalesces deltas within its window and keeps frame order."""
+
+    @staticmethod
+    def _capture() -> tuple[list[dict[str, Any]], Any]:
+        frames: list[dict[str, Any]] = []
+
+        async def send_frame(frame: dict[str, Any]) -> None:
+            frames.append(frame)
+
+        return frames, send_frame
+
+    async def test_coalesces_back_to_back_deltas(self) -> None:
+        frames, send_frame = self._capture()
+        batcher = _DeltaBatcher(send_frame)
+        batcher.add("a")
+        batcher.add("b")
+        await batcher.flush()
+        assert frames == [{"type": "assistant", "delta": "ab"}]
+
+    async def test_sends_after_window_without_flush(self) -> None:
+        frames, send_frame = self._capture()
+        batcher = _DeltaBatcher(send_frame, window=0.001)
+        batcher.add("a")
+        await asyncio.sleep(0.05)
+        assert frames == [{"type": "assistant", "delta": "a"}]
+        batcher.add("b")
+        await batcher.flush()
+        assert frames[-1] == {"type": "assistant", "delta": "b"}
+
+    async def test_sends_early_once_max_chars_pending(self) -> None:
+        frames, send_frame = self._capture()
+        batcher = _DeltaBatcher(send_frame, window=60, max_chars=4)
+        batcher.add("ab")
+        batcher.add("cd")
+        await asyncio.sleep(0)
+        assert frames == [{"type": "assistant", "delta": "abcd"}]
+        batcher.add("e")
+        await batcher.flush()
+        assert frames[-1] == {"type": "assistant", "delta": "e"}
+
+    async def test_flush_with_nothing_pending_sends_nothing(self) -> None:
+        frames, send_frame = self._capture()
+        await _DeltaBatcher(send_frame).flush()
+        assert frames == []
+
+    async def test_discard_drops_pending(self) -> None:
+        frames, send_frame = self._capture()
+        batcher = _DeltaBatcher(send_frame, window=0.001)
+        batcher.add("a")
+        batcher.discard()
+        await asyncio.sleep(0.05)
+        assert frames == []
+
+    async def test_context_manager_flushes_before_error_propagates(self) -> None:
+        frames, send_frame = self._capture()
+        with pytest.raises(RuntimeError, match="boom"):
+            async with _DeltaBatcher(send_frame) as batcher:
+                batcher.add("partial")
+                raise RuntimeError("boom")
+        assert frames == [{"type": "assistant", "delta": "partial"}]
+
+    async def test_timed_send_error_raised_on_flush(self) -> None:
+        send_frame = AsyncMock(side_effect=ConnectionError("gone"))
+        batcher = _DeltaBatcher(send_frame, window=0.001)
+        batcher.add("a")
+        await asyncio.sleep(0.05)
+        with pytest.raises(ConnectionError, match="gone"):
+            await batcher.flush()
+
+
+class TestHasQueryToken:
+    """_has_query_token() detects the deprecated ?token= parameter."""
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("/", False),
+            ("/?token=abc", True),
+            ("/?a=1&token=abc&b=2", True),
+            ("/?token=", False),
+            ("/?tokens=abc", False),
+            ("/?a=token", False),
+        ],
+    )
+    async def test_detection(self, path: str, expected: bool) -> None:
+        assert _has_query_token(path) is expected
+
+
+class TestSendTrusted:
+    """Gateway-built frames are serialized without outbound validation."""
+
+    async def test_send_trusted_skips_validation(self) -> None:
+        ws = AsyncMock()
+        session = GatewaySession(ws)
+        with patch("gateway.server.validate_outbound") as mock_validate:
+            await session.send_trusted({"type": "transcription", "text": "hi"})
+        mock_validate.assert_not_called()
+        ws.send.assert_awaited_once_with('{"type":"transcription","text":"hi"}')
+
+    async def test_send_error_skips_validation(self) -> None:
+        ws = AsyncMock()
+        session = GatewaySession(ws)
+        with patch("gateway.server.validate_outbound") as mock_validate:
+            await session.send_error("bad", ErrorCode.INVALID_FRAME)
+        mock_validate.assert_not_called()
+        ws.send.assert_awaited_once_with('{"type":"error","detail":"bad","code":"INVALID_FRAME"}')
+
+
+class TestEncodeError:
+    """Error frames are spliced from per-code templates."""
+
+    @pytest.mark.parametrize("code", list(ErrorCode))
+    async def test_matches_serialize(self, code: ErrorCode) -> None:
+        detail = 'bad "frame" — é'
+        expected = serialize({"type": "error", "detail": detail, "code": code})
+        assert _encode_error(detail, code) == expected
+
+
+class TestEncodeAssistantDelta:
+    """Assistant frames are spliced into a fixed envelope without validation."""
+
+    @pytest.mark.parametrize("delta", ["hi", "", 'quote " and \\ slash', "line\nbreak", "héllo ✓"])
+    async def test_matches_serialize(self, delta: str) -> None:
+        frame = {"type": "assistant", "delta": delta}
+        assert _encode_assistant_delta(delta) == serialize(frame)
+
+    async def test_batcher_send_raw_skips_validation(self) -> None:
+        ws = AsyncMock()
+        session = GatewaySession(ws)
+        with patch("gateway.server.validate_outbound") as mock_validate:
+            async with _DeltaBatcher(session.send_frame, send_raw=session.send_raw) as batcher:
+                batcher.add("h")
+                batcher.add("i")
+        mock_validate.assert_not_called()
+        ws.send.assert_awaited_once_with('{"type":"assistant","delta":"hi"}')
+
+    async def test_send_frame_still_validates(self) -> None:
+        session = GatewaySession(AsyncMock())
+        with pytest.raises(ProtocolError):
+            await session.send_frame({"type": "assistant", "delta": 1})
+
+
+class TestPrebuiltFrames:
+    """Canned status/end frames are encoded once and match serialize()."""
+
+    async def test_status_frames(self) -> None:
+        for state, data in _STATUS_FRAMES.items():
+            assert json.loads(data) == {"type": "status", "status": state}
+
+    async def test_end_frame(self) -> None:
+        assert json.loads(_END_FRAME) == {"type": "end"}
+
+    async def test_connected_frame(self) -> None:
+        assert json.loads(_CONNECTED_FRAME) == {"type": "connected", "version": "1.0"}
+
+
+class TestEventLoopFactory:
+    """event_loop_factory() picks uvloop only when it is importable."""
+
+    async def test_falls_back_to_stdlib_loop(self) -> None:
+        with patch.dict("sys.modules", {"uvloop": None}):
+            assert event_loop_factory() is None
+
+    async def test_uses_uvloop_when_installed(self) -> None:
+        fake_uvloop = MagicMock()
+        with patch.dict("sys.modules", {"uvloop": fake_uvloop}):
+            assert event_loop_factory() is fake_uvloop.new_event_loop
+
+
+class TestServeOptions:
+    """serve() passes the tuned websockets options."""
+
+    async def test_serve_kwargs(self) -> None:
+        class _Stop(Exception):
+            pass
+
+        config = GatewayConfig(gateway_host="127.0.0.1", gateway_port=0)
+        gw = GatewayServer(config)
+        with patch("gateway.server.websockets.serve") as mock_serve:
+            mock_serve.return_value.__aenter__.side_effect = _Stop
+            with pytest.raises(_Stop):
+                await gw.serve()
+
+        kwargs = mock_serve.call_args.kwargs
+        assert kwargs["compression"] is None
+        assert kwargs["max_queue"] == 16
+        assert kwargs["max_size"] == 2**16
+        assert "origins" not in kwargs
+
 
 class TestHealthCheck:
     """Tests for the /healthz HTTP health check endpoint."""
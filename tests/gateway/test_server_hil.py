@@ -20,13 +20,16 @@ class FakeWebSocket:
     def __init__(self, messages: list[str | bytes] | None = None) -> None:
         self._messages: list[str | bytes] = messages or []
         self._sent: list[str | bytes] = []
+        self._sent_parsed: list[dict[str, Any]] = []
 
     @property
     def sent_frames(self) -> list[dict[str, Any]]:
-        return [json.loads(m) for m in self._sent if isinstance(m, str)]
+        return self._sent_parsed
 
     async def send(self, data: str | bytes) -> None:
         self._sent.append(data)
+        if isinstance(data, str):
+            self._sent_parsed.append(json.loads(data))
 
     async def close(self, code: int = 1000, reason: str = "") -> None:
         pass
@@ -50,12 +53,14 @@ class MockTranscriber:
 
     def __init__(self, result: str = "test transcription") -> None:
         self._result = result
-        self._calls: list[np.ndarray] = []
+        self.call_count = 0
+        self.last_audio: np.ndarray | None = None
 
     async def transcribe(
         self, audio: np.ndarray, language: str = "en", timeout: float = 30.0
     ) -> str:
-        self._calls.append(audio)
+        self.call_count += 1
+        self.last_audio = audio
         return self._result
 
 
@@ -105,7 +110,7 @@ class TestHilTtsFlow:
         assert "thinking" not in statuses
 
         # Transcriber should have been called
-        assert len(transcriber._calls) == 1
+        assert transcriber.call_count == 1
 
     async def test_stop_audio_without_hil_uses_real_buffer(self) -> None:
         """stop_audio without hilText uses the real audio buffer (production path)."""
@@ -7,7 +7,7 @@ import json
 import secrets
 from collections.abc import AsyncIterator
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import websockets
@@ -85,7 +85,7 @@ class TestOpenClawResponseHandler:
     """Test OpenClawResponseHandler in isolation with mocked OpenClawClient."""
 
     async def test_full_flow_streams_deltas_and_end(self) -> None:
-        """Text message → streaming status → 5 deltas → end."""
+        """Text message → streaming status → coalesced deltas → end."""
         deltas = ["one ", "two ", "three ", "four ", "five"]
         client = AsyncMock(spec=OpenClawClient)
         client.send_message.return_value = _FakeStream(deltas)
@@ -98,11 +98,12 @@ class TestOpenClawResponseHandler:
 
         await handler.handle("hello", capture)
 
-        assert frames[0] == {"type": "status", "status": "streaming"}
-        for i, d in enumerate(deltas):
-            assert frames[1 + i] == {"type": "assistant", "delta": d}
-        assert frames[-1] == {"type": "end"}
-        assert len(frames) == 1 + len(deltas) + 1  # streaming + deltas + end
+        # Deltas yielded back-to-back are coalesced into a single frame
+        assert frames == [
+            {"type": "status", "status": "streaming"},
+            {"type": "assistant", "delta": "".join(deltas)},
+            {"type": "end"},
+        ]
 
     async def test_openclaw_error_during_streaming_propagates(self) -> None:
         """OpenClawError raised in stream propagates to caller."""
@@ -193,8 +194,7 @@ class TestHandleTextWithOpenClaw:
         assert frames[1]["status"] == "streaming"
 
         delta_frames = [f for f in frames if f["type"] == "assistant"]
-        assert len(delta_frames) == 5
-        assert [d["delta"] for d in delta_frames] == deltas
+        assert "".join(d["delta"] for d in delta_frames) == "".join(deltas)
 
         assert {"type": "end"} in frames
         assert frames[-1] == {"type": "status", "status": "idle"}
@@ -235,6 +235,35 @@ class TestHandleTextWithOpenClaw:
         assert "1s timeout" in error_frames[0]["detail"]
         assert frames[-1] == {"type": "status", "status": "idle"}
 
+    async def test_start_stream_timeout_sends_timeout_frame(self) -> None:
+        """start_stream() exceeding timeout on the server path → TIMEOUT → idle."""
+
+        async def _hang(*args: Any, **kwargs: Any) -> None:
+            await asyncio.sleep(300)
+
+        client = AsyncMock(spec=OpenClawClient)
+        client.send_message.side_effect = _hang
+
+        handler = OpenClawResponseHandler(client)
+        server = GatewayServer(GatewayConfig(), handler=handler)
+        fake_ws = _FakeWebSocket()
+        session = GatewaySession(
+            fake_ws,  # type: ignore[arg-type]
+            handler=handler,
+            timeout=1,
+            server=server,
+        )
+
+        await session._handle_text({"type": "text", "message": "hello"})
+
+        frames = fake_ws.frames()
+        error_frames = [f for f in frames if f["type"] == "error"]
+        assert len(error_frames) == 1
+        assert error_frames[0]["code"] == "TIMEOUT"
+        assert frames[-1] == {"type": "status", "status": "idle"}
+        assert session._state == SessionState.IDLE
+        client.close.assert_awaited_once()
+
     async def test_connection_refused_sends_openclaw_error(self) -> None:
         """OpenClaw not running → OPENCLAW_ERROR frame → idle."""
         client = AsyncMock(spec=OpenClawClient)
@@ -278,7 +307,7 @@ class TestEmptyTranscriptionSkipsOpenClaw:
         )
 
         # Simulate a recording in progress with a non-empty buffer
-        buf = AsyncMock()
+        buf = MagicMock()
         buf.is_empty = False
         buf.to_numpy.return_value = "fake-audio"
         session._audio_buffer = buf
@@ -313,7 +342,7 @@ class TestEmptyTranscriptionSkipsOpenClaw:
             transcriber=mock_transcriber,
         )
 
-        buf = AsyncMock()
+        buf = MagicMock()
         buf.is_empty = False
         buf.to_numpy.return_value = "fake-audio"
         session._audio_buffer = buf
@@ -325,6 +354,9 @@ class TestEmptyTranscriptionSkipsOpenClaw:
 
         # Should have transcription frame then return to idle (user confirms explicitly)
         assert {"type": "transcription", "text": "hello world"} in frames
+        # The session buffer is kept and cleared for the next recording
+        assert session._audio_buffer is buf
+        buf.reset.assert_called_once()
         # After transcription, should return to idle (user confirms explicitly)
         statuses = [f.get("status") for f in frames if f["type"] == "status"]
         assert statuses[-1] == "idle"
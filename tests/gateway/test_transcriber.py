@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import sys
+import threading
 import time
 from collections.abc import Iterator
 from types import ModuleType
@@ -137,3 +138,49 @@ class TestTranscribeErrors:
         t = _build_transcriber()
         with pytest.raises(asyncio.TimeoutError):
             await t.transcribe(DUMMY_AUDIO, timeout=0.1)
+
+
+class TestExecutor:
+    async def test_inference_runs_on_dedicated_thread(self, mock_model: MagicMock) -> None:
+        """Inference runs on the transcriber's own worker, not the default executor."""
+        thread_names: list[str] = []
+
+        def record_thread(*args: Any, **kwargs: Any) -> tuple[Any, MagicMock]:
+            thread_names.append(threading.current_thread().name)
+            return iter([_make_segment("hi")]), _make_info()
+
+        mock_model.transcribe.side_effect = record_thread
+        t = _build_transcriber()
+        await t.transcribe(DUMMY_AUDIO)
+        await t.transcribe(DUMMY_AUDIO)
+        t.close()
+        assert len(thread_names) == 2
+        assert all(name.startswith("whisper") for name in thread_names)
+        assert len(set(thread_names)) == 1
+
+    async def test_close_rejects_new_work(self, mock_model: MagicMock) -> None:
+        t = _build_transcriber()
+        t.close()
+        with pytest.raises(RuntimeError, match="shutdown"):
+            await t.transcribe(DUMMY_AUDIO)
+
+
+class TestWarmup:
+    async def test_warmup_decodes_silence_without_vad(self, mock_model: MagicMock) -> None:
+        consumed: list[bool] = []
+
+        def segments() -> Iterator[MagicMock]:
+            consumed.append(True)
+            yield _make_segment("")
+
+        mock_model.transcribe.return_value = (segments(), _make_info())
+        t = _build_transcriber()
+        await t.warmup()
+        t.close()
+
+        args, kwargs = mock_model.transcribe.call_args
+        audio = args[0]
+        assert audio.dtype == np.float32
+        assert not audio.any()
+        assert kwargs["vad_filter"] is False
+        assert consumed == [True]
@@ -0,0 +1,406 @@
+"""Tests for infra.azure_ops — no real az or bicep processes are spawned."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from infra import azure_ops
+from infra.azure_ops import CommandResult
+
+_OK = CommandResult(success=True, stdout="ok", stderr="", return_code=0)
+_FAIL = CommandResult(success=False, stdout="", stderr="boom", return_code=1)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point the CLI cache at tmp_path and forget any resolved executables."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    azure_ops._az_executable.cache_clear()
+    azure_ops._bicep_executable.cache_clear()
+
+
+class TestRunMany:
+    """run_many fans independent operations out to threads."""
+
+    def test_results_in_call_order(self) -> None:
+        def slow() -> CommandResult:
+            time.sleep(0.05)
+            return CommandResult(success=True, stdout="slow", stderr="", return_code=0)
+
+        def fast() -> CommandResult:
+            return CommandResult(success=True, stdout="fast", stderr="", return_code=0)
+
+        results = azure_ops.run_many([slow, fast])
+        assert [r.stdout for r in results] == ["slow", "fast"]
+
+    def test_calls_run_concurrently(self) -> None:
+        # Sequential execution would leave the first call waiting on the barrier forever
+        barrier = threading.Barrier(2, timeout=2)
+
+        def call() -> CommandResult:
+            barrier.wait()
+            return _OK
+
+        assert azure_ops.run_many([call, call]) == [_OK, _OK]
+
+    def test_single_call_runs_inline(self) -> None:
+        threads: list[threading.Thread] = []
+
+        def call() -> CommandResult:
+            threads.append(threading.current_thread())
+            return _OK
+
+        assert azure_ops.run_many([call]) == [_OK]
+        assert threads == [threading.main_thread()]
+
+    def test_empty(self) -> None:
+        assert azure_ops.run_many([]) == []
+
+    def test_exception_propagates(self) -> None:
+        def boom() -> CommandResult:
+            raise RuntimeError("az exploded")
+
+        with pytest.raises(RuntimeError, match="az exploded"):
+            azure_ops.run_many([lambda: _OK, boom])
+
+
+# ---------------------------------------------------------------------------
+# Prerequisite check cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def az_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A fake az binary on disk, with no standalone bicep."""
+    az = tmp_path / "bin" / "az"
+    az.parent.mkdir()
+    az.write_text("")
+    monkeypatch.setattr(azure_ops, "_az_executable", lambda: str(az))
+    monkeypatch.setattr(azure_ops, "_bicep_executable", lambda: None)
+    return az
+
+
+@pytest.fixture
+def bicep_version() -> Iterator[MagicMock]:
+    """Stub the Bicep version check with a successful result."""
+    result = CommandResult(success=True, stdout="Bicep CLI 0.30.3", stderr="", return_code=0)
+    with patch.object(azure_ops, "_run_bicep", return_value=result) as mock:
+        yield mock
+
+
+@pytest.mark.usefixtures("az_path")
+class TestCheckPrerequisitesCache:
+    """A successful check is cached on disk, keyed by the installed toolchain."""
+
+    def test_miss_then_hit(self, bicep_version: MagicMock) -> None:
+        first = azure_ops.check_prerequisites()
+        second = azure_ops.check_prerequisites()
+
+        assert first.success and second.success
+        assert second.stdout == first.stdout == "az CLI found. Bicep CLI 0.30.3"
+        bicep_version.assert_called_once_with(["--version"])
+        assert azure_ops._prereq_cache_path().is_file()
+
+    def test_use_cache_false_always_checks(self, bicep_version: MagicMock) -> None:
+        azure_ops.check_prerequisites()
+        azure_ops.check_prerequisites(use_cache=False)
+        assert bicep_version.call_count == 2
+
+    def test_ttl_expiry(self, bicep_version: MagicMock) -> None:
+        azure_ops.check_prerequisites()
+        stale = time.time() - azure_ops._PREREQ_CACHE_TTL - 1
+        os.utime(azure_ops._prereq_cache_path(), (stale, stale))
+
+        azure_ops.check_prerequisites()
+        assert bicep_version.call_count == 2
+
+    def test_az_upgrade_invalidates(self, az_path: Path, bicep_version: MagicMock) -> None:
+        azure_ops.check_prerequisites()
+        st = az_path.stat()
+        os.utime(az_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        azure_ops.check_prerequisites()
+        assert bicep_version.call_count == 2
+
+    def test_new_bicep_binary_invalidates(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, bicep_version: MagicMock
+    ) -> None:
+        azure_ops.check_prerequisites()
+        bicep = tmp_path / "bin" / "bicep"
+        bicep.write_text("")
+        monkeypatch.setattr(azure_ops, "_bicep_executable", lambda: str(bicep))
+
+        azure_ops.check_prerequisites()
+        assert bicep_version.call_count == 2
+
+    def test_failure_not_cached(self) -> None:
+        with patch.object(azure_ops, "_run_bicep", return_value=_FAIL) as mock:
+            assert not azure_ops.check_prerequisites().success
+            assert not azure_ops.check_prerequisites().success
+        assert mock.call_count == 2
+        assert not azure_ops._prereq_cache_path().exists()
+
+    def test_corrupt_cache_ignored(self, bicep_version: MagicMock) -> None:
+        path = azure_ops._prereq_cache_path()
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        assert azure_ops.check_prerequisites().success
+        bicep_version.assert_called_once()
+        assert "fingerprint" in json.loads(path.read_text())
+
+    def test_missing_az_is_not_cached(
+        self, monkeypatch: pytest.MonkeyPatch, bicep_version: MagicMock
+    ) -> None:
+        monkeypatch.setattr(azure_ops, "_az_executable", lambda: None)
+        result = azure_ops.check_prerequisites()
+
+        assert not result.success
+        assert "Azure CLI" in result.stderr
+        bicep_version.assert_not_called()
+        assert not azure_ops._prereq_cache_path().exists()
+
+
+# ---------------------------------------------------------------------------
+# Bicep invocation
+# ---------------------------------------------------------------------------
+
+
+class TestRunBicep:
+    """_run_bicep calls the standalone binary when present, else ``az bicep``."""
+
+    def test_standalone_binary(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(azure_ops, "_bicep_executable", lambda: "/opt/bicep")
+        with patch.object(azure_ops, "_run", return_value=_OK) as run:
+            azure_ops._run_bicep(["build", "main.bicep", "--outfile", "out.json"])
+        run.assert_called_once_with(
+            ["/opt/bicep", "build", "main.bicep", "--outfile", "out.json"], timeout=600
+        )
+
+    @pytest.mark.parametrize(
+        ("args", "az_args"),
+        [
+            (["--version"], ["bicep", "version"]),
+            (
+                ["build", "main.bicep", "--outfile", "out.json"],
+                ["bicep", "build", "--file", "main.bicep", "--outfile", "out.json"],
+            ),
+            (
+                ["build-params", "dev.bicepparam", "--outfile", "p.json"],
+                ["bicep", "build-params", "--file", "dev.bicepparam", "--outfile", "p.json"],
+            ),
+        ],
+    )
+    def test_az_fallback(
+        self, monkeypatch: pytest.MonkeyPatch, args: list[str], az_args: list[str]
+    ) -> None:
+        monkeypatch.setattr(azure_ops, "_bicep_executable", lambda: None)
+        with patch.object(azure_ops, "_run_az", return_value=_OK) as run_az:
+            azure_ops._run_bicep(args)
+        run_az.assert_called_once_with(az_args, timeout=600)
+
+    def test_az_env_disables_telemetry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(azure_ops, "_az_executable", lambda: "/usr/bin/az")
+        monkeypatch.delenv("AZURE_CORE_COLLECT_TELEMETRY", raising=False)
+        completed = MagicMock(returncode=0, stdout=" out \n", stderr="")
+        with patch.object(azure_ops.subprocess, "run", return_value=completed) as run:
+            result = azure_ops._run_az(["version"])
+
+        assert result == CommandResult(success=True, stdout="out", stderr="", return_code=0)
+        argv = run.call_args.args[0]
+        assert argv == ["/usr/bin/az", "version"]
+        assert run.call_args.kwargs["env"]["AZURE_CORE_COLLECT_TELEMETRY"] == "0"
+
+
+# ---------------------------------------------------------------------------
+# Compiled template cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def sources(tmp_path: Path) -> tuple[Path, Path]:
+    """A root template with one module, plus a parameter file."""
+    root = tmp_path / "infra"
+    (root / "modules").mkdir(parents=True)
+    (root / "main.bicep").write_text("module m 'modules/m.bicep' = {}\n")
+    (root / "modules" / "m.bicep").write_text("param name string\n")
+    param_file = root / "dev.bicepparam"
+    param_file.write_text("using 'main.bicep'\n")
+    return root / "main.bicep", param_file
+
+
+def _fake_build(
+    argv: list[str], *, timeout: int, env: dict[str, str] | None = None
+) -> CommandResult:
+    """Stand in for the Bicep compiler by writing its ``--outfile``."""
+    Path(argv[argv.index("--outfile") + 1]).write_text("{}")
+    return _OK
+
+
+@pytest.fixture
+def bicep_build(monkeypatch: pytest.MonkeyPatch) -> Iterator[MagicMock]:
+    """Route Bicep builds to :func:`_fake_build` via the standalone binary path."""
+    monkeypatch.setattr(azure_ops, "_bicep_executable", lambda: "bicep")
+    with patch.object(azure_ops, "_run", side_effect=_fake_build) as run:
+        yield run
+
+
+class TestSourceDigest:
+    def test_stable(self, sources: tuple[Path, Path]) -> None:
+        assert azure_ops._source_digest(*sources) == azure_ops._source_digest(*sources)
+
+    def test_module_edit_changes_digest(self, sources: tuple[Path, Path]) -> None:
+        template, _ = sources
+        before = azure_ops._source_digest(*sources)
+        (template.parent / "modules" / "m.bicep").write_text("param name string = 'x'\n")
+        assert azure_ops._source_digest(*sources) != before
+
+    def test_param_edit_changes_digest(self, sources: tuple[Path, Path]) -> None:
+        _, param_file = sources
+        before = azure_ops._source_digest(*sources)
+        param_file.write_text("using 'main.bicep'\nparam name = 'y'\n")
+        assert azure_ops._source_digest(*sources) != before
+
+    def test_bicepconfig_edit_changes_digest(self, sources: tuple[Path, Path]) -> None:
+        template, _ = sources
+        config = template.parent / "bicepconfig.json"
+        config.write_text('{"analyzers": {}}')
+        before = azure_ops._source_digest(*sources)
+        config.write_text('{"analyzers": {"core": {"enabled": false}}}')
+        assert azure_ops._source_digest(*sources) != before
+
+    def test_ancestor_bicepconfig_is_covered(self, sources: tuple[Path, Path]) -> None:
+        template, _ = sources
+        config = template.parent.parent / "bicepconfig.json"
+        config.write_text("{}")
+        before = azure_ops._source_digest(*sources)
+        config.write_text('{"experimentalFeaturesEnabled": {}}')
+        assert azure_ops._source_digest(*sources) != before
+
+    @pytest.mark.parametrize(
+        "call",
+        ["loadTextContent('x.txt')", "loadJsonContent('x.json')", "loadFileAsBase64 ('x.bin')"],
+    )
+    def test_load_function_disables_caching(self, sources: tuple[Path, Path], call: str) -> None:
+        template, _ = sources
+        (template.parent / "modules" / "m.bicep").write_text(f"var v = {call}\n")
+        assert azure_ops._source_digest(*sources) is None
+
+
+class TestCompileBicep:
+    """compile_bicep builds once per source digest and reuses the output."""
+
+    def test_miss_builds_template_and_params(
+        self, sources: tuple[Path, Path], bicep_build: MagicMock
+    ) -> None:
+        template, param_file = sources
+        compiled = azure_ops.compile_bicep(str(param_file), template)
+
+        assert compiled is not None
+        assert compiled.template_file.is_file()
+        assert compiled.parameters_file.is_file()
+        assert compiled.template_file.parent.name == azure_ops._source_digest(*sources)
+        commands = [call.args[0][1] for call in bicep_build.call_args_list]
+        assert commands == ["build", "build-params"]
+
+    def test_hit_skips_build(self, sources: tuple[Path, Path], bicep_build: MagicMock) -> None:
+        template, param_file = sources
+        first = azure_ops.compile_bicep(str(param_file), template)
+        bicep_build.reset_mock()
+
+        assert azure_ops.compile_bicep(str(param_file), template) == first
+        bicep_build.assert_not_called()
+
+    def test_source_edit_rebuilds_into_new_dir(
+        self, sources: tuple[Path, Path], bicep_build: MagicMock
+    ) -> None:
+        template, param_file = sources
+        first = azure_ops.compile_bicep(str(param_file), template)
+        (template.parent / "modules" / "m.bicep").write_text("param name string = 'z'\n")
+        second = azure_ops.compile_bicep(str(param_file), template)
+
+        assert first is not None and second is not None
+        assert second.template_file.parent != first.template_file.parent
+        assert first.template_file.is_file()
+        assert bicep_build.call_count == 4
+
+    @pytest.mark.parametrize("failing", ["build", "build-params"])
+    def test_build_failure_returns_none(
+        self, sources: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch, failing: str
+    ) -> None:
+        template, param_file = sources
+        monkeypatch.setattr(azure_ops, "_bicep_executable", lambda: "bicep")
+
+        def build(
+            argv: list[str], *, timeout: int, env: dict[str, str] | None = None
+        ) -> CommandResult:
+            return _FAIL if argv[1] == failing else _fake_build(argv, timeout=timeout)
+
+        with patch.object(azure_ops, "_run", side_effect=build):
+            assert azure_ops.compile_bicep(str(param_file), template) is None
+
+        # No half-built output is published or left behind in staging
+        assert list((azure_ops._cache_dir() / "compiled").iterdir()) == []
+
+    def test_load_function_skips_compile(
+        self, sources: tuple[Path, Path], bicep_build: MagicMock
+    ) -> None:
+        template, param_file = sources
+        param_file.write_text("using 'main.bicep'\nparam name = loadTextContent('name.txt')\n")
+        assert azure_ops.compile_bicep(str(param_file), template) is None
+        bicep_build.assert_not_called()
+
+    def test_missing_param_file_returns_none(
+        self, sources: tuple[Path, Path], bicep_build: MagicMock
+    ) -> None:
+        template, param_file = sources
+        param_file.unlink()
+        assert azure_ops.compile_bicep(str(param_file), template) is None
+        bicep_build.assert_not_called()
+
+
+class TestTemplateArgs:
+    """Deployments use compiled ARM JSON when given, else the Bicep sources."""
+
+    def test_sources(self) -> None:
+        assert azure_ops._template_args("dev.bicepparam", None) == [
+            "--template-file",
+            str(azure_ops._DEFAULT_TEMPLATE),
+            "--parameters",
+            "dev.bicepparam",
+        ]
+
+    def test_compiled(self, tmp_path: Path) -> None:
+        compiled = azure_ops.CompiledTemplate(tmp_path / "main.json", tmp_path / "parameters.json")
+        assert azure_ops._template_args("dev.bicepparam", compiled) == [
+            "--template-file",
+            str(tmp_path / "main.json"),
+            "--parameters",
+            f"@{tmp_path / 'parameters.json'}",
+        ]
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            lambda c: azure_ops.run_deployment("sub", "eastus", "dev.bicepparam", compiled=c),
+            lambda c: azure_ops.validate_template("sub", "eastus", "dev.bicepparam", compiled=c),
+        ],
+        ids=["run_deployment", "validate_template"],
+    )
+    def test_operations_pass_compiled_json(
+        self, tmp_path: Path, operation: Callable[[azure_ops.CompiledTemplate], CommandResult]
+    ) -> None:
+        compiled = azure_ops.CompiledTemplate(tmp_path / "main.json", tmp_path / "parameters.json")
+        with patch.object(azure_ops, "_run_az", return_value=_OK) as run_az:
+            operation(compiled)
+
+        args = run_az.call_args.args[0]
+        assert args[args.index("--template-file") + 1] == str(compiled.template_file)
+        assert args[args.index("--parameters") + 1] == f"@{compiled.parameters_file}"
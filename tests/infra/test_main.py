@@ -0,0 +1,31 @@
+"""Tests for the infra CLI wiring in infra.main."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from infra import azure_ops
+from infra.azure_ops import CommandResult
+from infra.main import app
+from typer.testing import CliRunner
+
+_PREREQ_FAIL = CommandResult(success=False, stdout="", stderr="no az", return_code=1)
+
+runner = CliRunner()
+
+
+class TestNoCachePrereqFlag:
+    """--no-cache-prereq forwards use_cache=False to check_prerequisites."""
+
+    @pytest.mark.parametrize(
+        "command",
+        [["deploy", "-s", "sub"], ["what-if", "-s", "sub"], ["validate", "-s", "sub"], ["lint"]],
+    )
+    @pytest.mark.parametrize(("flags", "use_cache"), [([], True), (["--no-cache-prereq"], False)])
+    def test_flag(self, command: list[str], flags: list[str], use_cache: bool) -> None:
+        with patch.object(azure_ops, "check_prerequisites", return_value=_PREREQ_FAIL) as check:
+            result = runner.invoke(app, [*command, *flags])
+
+        assert result.exit_code == 1
+        check.assert_called_once_with(use_cache=use_cache)